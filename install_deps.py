@@ -53,7 +53,7 @@ def install_pyside6():
     except ImportError:
         print("正在安装 PySide6...")
         try:
-            subprocess.check_call([sys.executable, "-m", "pip", "install", "PySide6"])
+            subprocess.check_call([sys.executable, "-m", "pip", "install", "PySide6-Essentials"])
             print("PySide6 安装完成！")
         except subprocess.CalledProcessError as e:
             print(f"PySide6 安装失败: {e}")
@@ -76,7 +76,7 @@ def verify_installation():
         ("psutil", "psutil"),
         ("yaml", "pyyaml"),
         ("ttkbootstrap", "ttkbootstrap"),
-        ("PySide6", "PySide6"),
+        ("PySide6", "PySide6-Essentials"),
         ("pydantic", "pydantic"),
     ]
     
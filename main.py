@@ -20,12 +20,12 @@ def print_hi(name):
 
 async def run_automation(config_path: str = "config.yaml"):
     """运行自动化任务"""
-    try:
-        framework = GameAutomationFramework(config_path)
-        await framework.run()
-    except FileNotFoundError:
+    # 先检查配置文件是否存在，确保框架只构造一次
+    if not Path(config_path).is_file():
         print(f"配置文件 {config_path} 不存在，创建示例配置文件...")
         create_example_config(config_path)
+    
+    try:
         framework = GameAutomationFramework(config_path)
         await framework.run()
     except Exception as e:
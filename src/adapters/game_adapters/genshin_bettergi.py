@@ -709,8 +709,9 @@ def create_adapter_from_config(config_path: str) -> ConfigurableGenshinBetterGIA
         ConfigurableGenshinBetterGIAdapter实例
     """
     import yaml
+    from ...utils.config_parser import YAML_LOADER
     
     with open(config_path, 'r', encoding='utf-8') as f:
-        config = yaml.safe_load(f)
+        config = yaml.load(f, Loader=YAML_LOADER)
     
     return ConfigurableGenshinBetterGIAdapter(config)
\ No newline at end of file
@@ -2,41 +2,352 @@
 现代化GUI应用
 使用PySide6实现现代化界面
 """
+import os
 import sys
 import asyncio
+import tempfile
+import threading
+from contextlib import contextmanager
+from functools import partial
+from dataclasses import dataclass
+from datetime import datetime
 from pathlib import Path
 
 from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
-                              QPushButton, QTextEdit, QLabel, QTabWidget, QFileDialog, 
-                              QMessageBox, QSplitter, QListWidget, QTreeWidget, QTreeWidgetItem,
+                              QPushButton, QTextEdit, QPlainTextEdit, QLabel, QTabWidget, QFileDialog, 
+                              QMessageBox, QSplitter, QListWidget,
                               QGroupBox, QFormLayout, QLineEdit, QSpinBox, QCheckBox, QComboBox,
                               QMenuBar, QStatusBar, QToolBar, QDialog, QGridLayout, QHeaderView,
-                              QListWidgetItem, QAbstractItemView)
-from PySide6.QtCore import Qt, QThread, Signal, QObject, QTimer
-from PySide6.QtGui import QAction, QIcon
+                              QAbstractItemView, QTreeView, QListView, QDialogButtonBox)
+from PySide6.QtCore import Qt, QObject, QTimer, QThread, QMetaObject, Q_ARG, Slot, QAbstractTableModel, QModelIndex, QSize
+from PySide6.QtGui import QAction, QIcon, QTextCursor, QTextOption
+import PySide6.QtAsyncio as QtAsyncio
 
-from src.game_automation_framework import GameAutomationFramework
-from src.utils.config_validator import create_sample_config
+# 对话框下拉框和文件过滤器的固定选项
+_WF_TYPES = ("script_chain", "game", "task_chain", "mixed")
+_TASK_CHAIN_INDEX = _WF_TYPES.index("task_chain")
+_SCRIPT_TYPES = ("python", "exe", "bat", "ps1", "ahk")
+_SCRIPT_FILTERS = (
+    "Python文件 (*.py)", "可执行文件 (*.exe)", "批处理文件 (*.bat)",
+    "PowerShell文件 (*.ps1)", "AutoHotkey文件 (*.ahk)", "所有文件 (*)",
+)
 
 
-class LogSignal(QObject):
-    """日志信号类"""
-    message_logged = Signal(str)
+@dataclass
+class VariableEntry:
+    """变量列表项数据"""
+    __slots__ = ('name', 'value', 'description')
+    name: str
+    value: str
+    description: str
 
 
-class ExecutionThread(QThread):
-    """执行工作线程"""
-    def __init__(self, framework, workflow_name=None):
-        super().__init__()
-        self.framework = framework
-        self.workflow_name = workflow_name
-        
-    def run(self):
-        """运行框架"""
-        try:
-            asyncio.run(self.framework.run(self.workflow_name))
-        except Exception as e:
-            print(f"执行出错: {e}")
+@dataclass
+class GameEntry:
+    """游戏列表项数据"""
+    __slots__ = ('name', 'executable')
+    name: str
+    executable: str
+
+
+@dataclass
+class ScriptEntry:
+    """脚本列表项数据"""
+    __slots__ = ('path', 'type')
+    path: str
+    type: str
+
+
+@dataclass
+class WorkflowEntry:
+    """工作流列表项数据"""
+    __slots__ = ('name', 'type', 'description', 'enabled')
+    name: str
+    type: str
+    description: str
+    enabled: bool
+
+
+@dataclass
+class TaskChainEntry:
+    """任务链列表项数据"""
+    __slots__ = ('id', 'name', 'game', 'script', 'depends_on', 'enabled')
+    id: str
+    name: str
+    game: str
+    script: str
+    depends_on: list
+    enabled: bool
+
+
+def create_flat_tree_view(model):
+    """创建显示平铺列表模型的树视图，关闭层级装饰、展开动画和双击展开"""
+    view = QTreeView()
+    view.setRootIsDecorated(False)
+    view.setUniformRowHeights(True)
+    view.setAnimated(False)
+    view.setExpandsOnDoubleClick(False)
+    view.setModel(model)
+    return view
+
+
+def current_row(view):
+    """返回视图当前选中的顶层行号，未选中时返回-1"""
+    index = view.currentIndex()
+    if not index.isValid() or index.parent().isValid():
+        return -1
+    return index.row()
+
+
+def select_combo_text(combo, text):
+    """选中下拉框中的指定文本，找不到时选中第一项"""
+    combo.setCurrentIndex(max(combo.findText(text), 0))
+
+
+class RowButtonsBinder(QObject):
+    """让按钮的可用状态跟随视图的当前行，未选中时无法触发编辑、删除等操作
+
+    以第一个按钮为父对象；任一按钮销毁后不再更新，
+    避免窗口销毁过程中内部模型发出的重置信号访问已删除的按钮
+    """
+    
+    def __init__(self, view, buttons):
+        super().__init__(buttons[0])
+        self._selection_model = view.selectionModel()
+        self._buttons = tuple(buttons)
+        for button in self._buttons:
+            button.destroyed.connect(self._release_buttons)
+        self._selection_model.currentChanged.connect(self.refresh)
+        # 模型重置时选择模型直接清空当前行而不发出currentChanged
+        view.model().modelReset.connect(self.refresh)
+        self.refresh()
+    
+    @Slot()
+    def refresh(self):
+        """有当前行时才启用按钮"""
+        enabled = self._selection_model.currentIndex().isValid()
+        for button in self._buttons:
+            button.setEnabled(enabled)
+    
+    @Slot()
+    def _release_buttons(self):
+        """按钮开始销毁，之后不再访问任何按钮"""
+        self._buttons = ()
+
+
+def create_ok_cancel_buttons(dialog):
+    """创建连接到对话框接受/拒绝的确定、取消按钮组"""
+    buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel, dialog)
+    buttons.button(QDialogButtonBox.Ok).setText("确定")
+    buttons.button(QDialogButtonBox.Cancel).setText("取消")
+    buttons.accepted.connect(dialog.accept)
+    buttons.rejected.connect(dialog.reject)
+    return buttons
+
+
+def write_report(file_path, header, log_path, log_size):
+    """写出执行报告：报告头后接日志内容
+
+    日志内容直接从临时日志文件分块复制，不在内存中拼接整份日志；
+    只复制前log_size字节，界面线程在此期间追加的日志不会混入；
+    使用1MiB写缓冲，大日志只需少量系统调用
+    """
+    with open(file_path, 'wb', buffering=1 << 20) as f, open(log_path, 'rb') as log_file:
+        f.write(header.encode('utf-8'))
+        remaining = log_size
+        while remaining:
+            block = log_file.read(min(remaining, 1 << 20))
+            if not block:
+                break
+            f.write(block)
+            remaining -= len(block)
+
+
+@contextmanager
+def bulk_update(*widgets):
+    """批量修改期间暂停控件重绘、排序和信号
+
+    树控件的列不使用ResizeToContents模式（每插入一行都会重新计算整列宽度），
+    而是在批量修改结束后把手动宽度的列按内容统一调整一次。
+    """
+    saved_states = []
+    saved_sorting = []
+    for widget in widgets:
+        widget.setUpdatesEnabled(False)
+        saved_states.append((widget, widget.blockSignals(True)))
+        if isinstance(widget, QTreeView):
+            saved_sorting.append((widget, widget.isSortingEnabled()))
+            widget.setSortingEnabled(False)
+    try:
+        yield
+    finally:
+        for widget, sorting in saved_sorting:
+            header = widget.header()
+            for column in range(header.count()):
+                if header.sectionResizeMode(column) == QHeaderView.Interactive:
+                    widget.resizeColumnToContents(column)
+            widget.setSortingEnabled(sorting)
+        for widget, blocked in saved_states:
+            widget.blockSignals(blocked)
+            widget.setUpdatesEnabled(True)
+
+
+class EntryTableModel(QAbstractTableModel):
+    """以数据类列表为后端的表格模型基类
+
+    子类通过HEADERS给出列标题，FIELDS给出各列对应的数据类字段名，
+    需要组合多个字段显示的列可重写display_text。
+    行数据保存在Python列表中，Qt.UserRole返回该行的数据对象，
+    上移/下移只交换列表中的两个元素。
+    """
+    HEADERS = ("",)
+    FIELDS = ()
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return None
+    
+    def display_text(self, entry, column):
+        """返回某行某列显示的文字，未在FIELDS中给出字段的列显示整个数据对象"""
+        if column < len(self.FIELDS):
+            return str(getattr(entry, self.FIELDS[column]))
+        return str(entry)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            return self.display_text(self._rows[index.row()], index.column())
+        if role == Qt.UserRole:
+            return self._rows[index.row()]
+        return None
+    
+    def entries(self):
+        """返回全部行数据"""
+        return self._rows
+    
+    def entry(self, row):
+        """返回指定行的数据"""
+        return self._rows[row]
+    
+    def set_entries(self, entries):
+        """整体替换行数据"""
+        self.beginResetModel()
+        self._rows = list(entries)
+        self.endResetModel()
+    
+    def append_entry(self, entry):
+        """在末尾添加一行"""
+        row = len(self._rows)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._rows.append(entry)
+        self.endInsertRows()
+    
+    def replace_entry(self, row, entry):
+        """替换指定行的数据"""
+        self._rows[row] = entry
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.HEADERS) - 1))
+    
+    def remove_entry(self, row):
+        """删除指定行"""
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._rows[row]
+        self.endRemoveRows()
+    
+    def move_up(self, row):
+        """将指定行与上一行交换"""
+        if not 0 < row < len(self._rows):
+            return False
+        self.beginMoveRows(QModelIndex(), row, row, QModelIndex(), row - 1)
+        self._rows[row - 1], self._rows[row] = self._rows[row], self._rows[row - 1]
+        self.endMoveRows()
+        return True
+    
+    def move_down(self, row):
+        """将指定行与下一行交换"""
+        if not 0 <= row < len(self._rows) - 1:
+            return False
+        # 目标位置是移动前的下标，需越过下一行
+        self.beginMoveRows(QModelIndex(), row, row, QModelIndex(), row + 2)
+        self._rows[row], self._rows[row + 1] = self._rows[row + 1], self._rows[row]
+        self.endMoveRows()
+        return True
+
+
+class VariableModel(EntryTableModel):
+    """变量列表模型"""
+    HEADERS = ("变量名", "值", "描述")
+    FIELDS = ("name", "value", "description")
+
+
+class GameModel(EntryTableModel):
+    """游戏列表模型，显示为“名称: 可执行文件”"""
+    
+    def display_text(self, entry, column):
+        return f"{entry.name}: {entry.executable}"
+
+
+class ScriptModel(EntryTableModel):
+    """脚本列表模型，显示为“路径 (类型)”"""
+    
+    def display_text(self, entry, column):
+        return f"{entry.path} ({entry.type})"
+
+
+class TaskChainModel(EntryTableModel):
+    """任务链列表模型"""
+    HEADERS = ("ID", "名称", "游戏", "脚本", "依赖项", "启用")
+    FIELDS = ("id", "name", "game", "script")
+    
+    def display_text(self, entry, column):
+        if column == 4:
+            return ", ".join(entry.depends_on)
+        if column == 5:
+            return "是" if entry.enabled else "否"
+        return super().display_text(entry, column)
+
+
+class WorkflowModel(EntryTableModel):
+    """工作流列表模型，启用状态以第4列的勾选框表示"""
+    HEADERS = ("名称", "类型", "描述", "启用")
+    FIELDS = ("name", "type", "description")
+    ENABLED_COLUMN = 3
+    
+    def display_text(self, entry, column):
+        if column == self.ENABLED_COLUMN:
+            return None
+        return super().display_text(entry, column)
+    
+    def flags(self, index):
+        flags = super().flags(index)
+        if index.column() == self.ENABLED_COLUMN:
+            flags |= Qt.ItemIsUserCheckable
+        return flags
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if role == Qt.CheckStateRole:
+            if not index.isValid() or index.column() != self.ENABLED_COLUMN:
+                return None
+            return Qt.Checked if self._rows[index.row()].enabled else Qt.Unchecked
+        return super().data(index, role)
+    
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid() or role != Qt.CheckStateRole or index.column() != self.ENABLED_COLUMN:
+            return False
+        self._rows[index.row()].enabled = Qt.CheckState(value) == Qt.Checked
+        self.dataChanged.emit(index, index, [role])
+        return True
 
 
 class ModernMainWindow(QMainWindow):
@@ -47,17 +358,67 @@ class ModernMainWindow(QMainWindow):
         self.setWindowTitle("ScriptZero - 现代化游戏自动化框架")
         self.setGeometry(100, 100, 1400, 900)
         
-        # 日志信号
-        self.log_signal = LogSignal()
-        self.log_signal.message_logged.connect(self.append_log)
+        # 日志缓冲区，由定时器批量刷新到日志框
+        self._log_buffer = []
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(33)
+        self._log_flush_timer.timeout.connect(self._flush_logs)
+        self._scroll_pending = False
+        # 与“自动滚动”按钮的默认勾选状态一致
+        self._auto_scroll_enabled = True
+        
+        # 状态栏消息合并，连续多次更新只显示最后一条
+        self._pending_status = ""
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(16)
+        self._status_timer.timeout.connect(self._flush_status)
+        
+        # 日志同步写入临时文件，保存日志时直接复制文件
+        self._log_file = self._new_log_file()
+        # 清空日志后弃用的临时文件，后台保存任务结束后再删除
+        self._retired_log_paths = []
+        
+        # 文件对话框，首次使用时创建并复用，保留上次访问的目录
+        self._open_dialog = None
+        self._save_dialog = None
+        self._save_path_callback = None
+        
+        # 提示消息框，首次使用时创建并复用
+        self._message_box = None
+        
+        # 编辑对话框，按类型首次使用时创建并复用
+        self._dialogs = {}
         
         # 框架实例
         self.framework = None
-        self.execution_thread = None
+        self._framework_config = None
+        self.execution_task = None
+        self._cancel_event = None
+        # 运行框架的工作线程事件循环
+        self._worker_loop = None
+        # 后台文件任务，保留引用防止任务被回收
+        self._file_tasks = set()
+        
+        # 已解析配置缓存: {文件路径: ((修改时间, 文件大小), 配置)}
+        self._config_cache = {}
+        
+        # 从界面收集的配置数据缓存，界面修改后失效
+        # 各列表分段缓存，只有被修改的列表才会重新遍历
+        self._config_data_cache = None
+        self._section_cache = {}
+        self._config_dirty = True
+        # 游戏/脚本的候选项与按键索引缓存，与分段缓存同步失效
+        self._choices_cache = {}
+        self._preview_cache = None
         
         # 初始化界面
         self.init_ui()
         
+        # 监听配置控件变化
+        self._connect_dirty_signals()
+        
     def init_ui(self):
         """初始化用户界面"""
         # 创建中心部件
@@ -91,80 +452,107 @@ class ModernMainWindow(QMainWindow):
         # 状态栏
         self.statusBar().showMessage("就绪")
         
+    # 确认对话框的按钮组合
+    _YES_NO = QMessageBox.Yes | QMessageBox.No
+    
+    # 停止执行时等待框架协作式退出的宽限时间（毫秒），超时后强制取消
+    _STOP_GRACE_MS = 5000
+    
+    # 自动滚动开关的状态栏提示
+    _AUTO_SCROLL_MSG = {True: "自动滚动已开启", False: "自动滚动已关闭"}
+    
+    # 候选项索引表: {分段名: (模型属性名, 作为键的条目字段)}
+    _CHOICE_KEYS = {'games': ('games_model', 'name'), 'scripts': ('scripts_model', 'path')}
+    
+    # 菜单动作表: (菜单名, [(菜单文字, 工具栏文字, 处理方法名), ...])
+    # 工具栏文字为None的动作不放入工具栏，None表示分隔符
+    _MENU_ACTIONS = (
+        ("文件", (
+            ("新建配置", "新建", "new_config"),
+            ("打开配置", "打开", "open_config"),
+            ("保存配置", "保存", "save_config"),
+            ("另存为", None, "save_config_as"),
+            None,
+            ("退出", None, "close"),
+        )),
+        ("执行", (
+            ("开始执行", "执行", "start_execution"),
+            ("停止执行", "停止", "stop_execution"),
+        )),
+        ("帮助", (
+            ("关于", None, "show_about"),
+        )),
+    )
+    
     def create_menu(self):
         """创建菜单栏"""
         menubar = self.menuBar()
         
-        # 文件菜单
-        file_menu = menubar.addMenu("文件")
-        
-        new_action = QAction("新建配置", self)
-        new_action.triggered.connect(self.new_config)
-        file_menu.addAction(new_action)
-        
-        open_action = QAction("打开配置", self)
-        open_action.triggered.connect(self.open_config)
-        file_menu.addAction(open_action)
-        
-        save_action = QAction("保存配置", self)
-        save_action.triggered.connect(self.save_config)
-        file_menu.addAction(save_action)
-        
-        save_as_action = QAction("另存为", self)
-        save_as_action.triggered.connect(self.save_config_as)
-        file_menu.addAction(save_as_action)
-        
-        file_menu.addSeparator()
-        
-        exit_action = QAction("退出", self)
-        exit_action.triggered.connect(self.close)
-        file_menu.addAction(exit_action)
-        
-        # 执行菜单
-        exec_menu = menubar.addMenu("执行")
-        
-        start_action = QAction("开始执行", self)
-        start_action.triggered.connect(self.start_execution)
-        exec_menu.addAction(start_action)
-        
-        stop_action = QAction("停止执行", self)
-        stop_action.triggered.connect(self.stop_execution)
-        exec_menu.addAction(stop_action)
-        
-        # 帮助菜单
-        help_menu = menubar.addMenu("帮助")
-        
-        about_action = QAction("关于", self)
-        about_action.triggered.connect(self.show_about)
-        help_menu.addAction(about_action)
+        # 菜单与工具栏共用同一组QAction，每组之间用分隔符隔开
+        self._toolbar_actions = []
+        for menu_title, entries in self._MENU_ACTIONS:
+            menu = menubar.addMenu(menu_title)
+            new_group = bool(self._toolbar_actions)
+            for entry in entries:
+                if entry is None:
+                    menu.addSeparator()
+                    continue
+                text, toolbar_text, handler = entry
+                action = QAction(text, self)
+                action.triggered.connect(getattr(self, handler))
+                menu.addAction(action)
+                if toolbar_text is not None:
+                    if new_group:
+                        self._toolbar_actions.append(None)
+                        new_group = False
+                    action.setIconText(toolbar_text)
+                    self._toolbar_actions.append(action)
         
     def create_toolbar(self):
         """创建工具栏"""
         toolbar = self.addToolBar("主工具栏")
         
-        # 添加按钮到工具栏
-        new_btn = QPushButton("新建")
-        new_btn.clicked.connect(self.new_config)
-        toolbar.addWidget(new_btn)
-        
-        open_btn = QPushButton("打开")
-        open_btn.clicked.connect(self.open_config)
-        toolbar.addWidget(open_btn)
-        
-        save_btn = QPushButton("保存")
-        save_btn.clicked.connect(self.save_config)
-        toolbar.addWidget(save_btn)
-        
-        toolbar.addSeparator()
-        
-        start_btn = QPushButton("执行")
-        start_btn.clicked.connect(self.start_execution)
-        toolbar.addWidget(start_btn)
-        
-        stop_btn = QPushButton("停止")
-        stop_btn.clicked.connect(self.stop_execution)
-        toolbar.addWidget(stop_btn)
-        
+        for action in self._toolbar_actions:
+            if action is None:
+                toolbar.addSeparator()
+            else:
+                toolbar.addAction(action)
+        
+    # 列表编辑区: (模型属性名, 模型类, 视图属性名, 各列宽度模式, [(按钮文字, 处理方法名), ...])
+    # 列宽度模式为None时使用列表视图，否则使用树视图；手动宽度的列在批量填充后按内容调整一次
+    _VARIABLES_EDITOR = (
+        "variables_model", VariableModel, "variables_tree",
+        (QHeaderView.Interactive, QHeaderView.Interactive, QHeaderView.Stretch),
+        (("添加变量", "add_variable"), ("编辑变量", "edit_variable"), ("删除变量", "delete_variable")),
+    )
+    
+    # 列表标签页: (标签名, 列表编辑区)
+    _LIST_TABS = (
+        ("游戏配置", (
+            "games_model", GameModel, "games_list", None,
+            (("添加游戏", "add_game"), ("编辑游戏", "edit_game"), ("删除游戏", "delete_game")),
+        )),
+        ("脚本配置", (
+            "scripts_model", ScriptModel, "scripts_list", None,
+            (("添加脚本", "add_script"), ("编辑脚本", "edit_script"), ("删除脚本", "delete_script"),
+             ("测试脚本", "test_script")),
+        )),
+        ("任务链配置", (
+            "task_chain_model", TaskChainModel, "task_chain_tree",
+            (QHeaderView.Interactive, QHeaderView.Interactive, QHeaderView.Interactive,
+             QHeaderView.Stretch, QHeaderView.Stretch, QHeaderView.Interactive),
+            (("添加任务", "add_task"), ("编辑任务", "edit_task"), ("删除任务", "delete_task"),
+             ("上移", "move_task_up"), ("下移", "move_task_down")),
+        )),
+        ("工作流", (
+            "workflow_model", WorkflowModel, "workflow_tree",
+            (QHeaderView.Interactive, QHeaderView.Interactive, QHeaderView.Stretch,
+             QHeaderView.Interactive),
+            (("添加工作流", "add_workflow"), ("编辑工作流", "edit_workflow"), ("删除工作流", "delete_workflow"),
+             ("上移", "move_workflow_up"), ("下移", "move_workflow_down")),
+        )),
+    )
+    
     def create_config_panel(self):
         """创建配置面板"""
         panel = QWidget()
@@ -172,26 +560,9 @@ class ModernMainWindow(QMainWindow):
         
         # 配置标签页
         tab_widget = QTabWidget()
-        
-        # 基本配置标签页
-        basic_tab = self.create_basic_config_tab()
-        tab_widget.addTab(basic_tab, "基本配置")
-        
-        # 游戏配置标签页
-        game_tab = self.create_game_config_tab()
-        tab_widget.addTab(game_tab, "游戏配置")
-        
-        # 脚本配置标签页
-        script_tab = self.create_script_config_tab()
-        tab_widget.addTab(script_tab, "脚本配置")
-        
-        # 任务链配置标签页
-        task_chain_tab = self.create_task_chain_config_tab()
-        tab_widget.addTab(task_chain_tab, "任务链配置")
-        
-        # 工作流配置标签页
-        workflow_tab = self.create_workflow_config_tab()
-        tab_widget.addTab(workflow_tab, "工作流")
+        tab_widget.addTab(self.create_basic_config_tab(), "基本配置")
+        for title, editor in self._LIST_TABS:
+            tab_widget.addTab(self.create_list_editor(QWidget(), *editor), title)
         
         layout.addWidget(tab_widget)
         
@@ -214,174 +585,42 @@ class ModernMainWindow(QMainWindow):
         layout.addRow("名称:", self.name_edit)
         
         # 变量配置
-        variables_group = QGroupBox("变量配置")
-        vars_layout = QVBoxLayout(variables_group)
-        
-        self.variables_tree = QTreeWidget()
-        self.variables_tree.setHeaderLabels(["变量名", "值", "描述"])
-        self.variables_tree.header().setSectionResizeMode(0, QHeaderView.ResizeToContents)
-        self.variables_tree.header().setSectionResizeMode(1, QHeaderView.ResizeToContents)
-        self.variables_tree.header().setSectionResizeMode(2, QHeaderView.Stretch)
-        
-        vars_buttons_layout = QHBoxLayout()
-        
-        add_var_btn = QPushButton("添加变量")
-        add_var_btn.clicked.connect(self.add_variable)
-        vars_buttons_layout.addWidget(add_var_btn)
-        
-        edit_var_btn = QPushButton("编辑变量")
-        edit_var_btn.clicked.connect(self.edit_variable)
-        vars_buttons_layout.addWidget(edit_var_btn)
-        
-        del_var_btn = QPushButton("删除变量")
-        del_var_btn.clicked.connect(self.delete_variable)
-        vars_buttons_layout.addWidget(del_var_btn)
-        
-        vars_layout.addWidget(self.variables_tree)
-        vars_layout.addLayout(vars_buttons_layout)
-        
+        variables_group = self.create_list_editor(QGroupBox("变量配置"), *self._VARIABLES_EDITOR)
         layout.addRow(variables_group)
         
         return widget
     
-    def create_game_config_tab(self):
-        """创建游戏配置标签页"""
-        widget = QWidget()
-        layout = QVBoxLayout(widget)
-        
-        self.games_list = QListWidget()
-        layout.addWidget(self.games_list)
-        
-        buttons_layout = QHBoxLayout()
-        
-        add_game_btn = QPushButton("添加游戏")
-        add_game_btn.clicked.connect(self.add_game)
-        buttons_layout.addWidget(add_game_btn)
-        
-        edit_game_btn = QPushButton("编辑游戏")
-        edit_game_btn.clicked.connect(self.edit_game)
-        buttons_layout.addWidget(edit_game_btn)
-        
-        del_game_btn = QPushButton("删除游戏")
-        del_game_btn.clicked.connect(self.delete_game)
-        buttons_layout.addWidget(del_game_btn)
-        
-        layout.addLayout(buttons_layout)
-        
-        return widget
-    
-    def create_script_config_tab(self):
-        """创建脚本配置标签页"""
-        widget = QWidget()
-        layout = QVBoxLayout(widget)
-        
-        self.scripts_list = QListWidget()
-        layout.addWidget(self.scripts_list)
-        
-        buttons_layout = QHBoxLayout()
-        
-        add_script_btn = QPushButton("添加脚本")
-        add_script_btn.clicked.connect(self.add_script)
-        buttons_layout.addWidget(add_script_btn)
-        
-        edit_script_btn = QPushButton("编辑脚本")
-        edit_script_btn.clicked.connect(self.edit_script)
-        buttons_layout.addWidget(edit_script_btn)
-        
-        del_script_btn = QPushButton("删除脚本")
-        del_script_btn.clicked.connect(self.delete_script)
-        buttons_layout.addWidget(del_script_btn)
-        
-        # 添加测试脚本按钮
-        test_script_btn = QPushButton("测试脚本")
-        test_script_btn.clicked.connect(self.test_script)
-        buttons_layout.addWidget(test_script_btn)
-        
-        layout.addLayout(buttons_layout)
-        
-        return widget
-    
-    def create_task_chain_config_tab(self):
-        """创建任务链配置标签页"""
-        widget = QWidget()
-        layout = QVBoxLayout(widget)
-        
-        self.task_chain_tree = QTreeWidget()
-        self.task_chain_tree.setHeaderLabels(["ID", "名称", "游戏", "脚本", "依赖项", "启用"])
-        self.task_chain_tree.header().setSectionResizeMode(0, QHeaderView.ResizeToContents)
-        self.task_chain_tree.header().setSectionResizeMode(1, QHeaderView.ResizeToContents)
-        self.task_chain_tree.header().setSectionResizeMode(2, QHeaderView.ResizeToContents)
-        self.task_chain_tree.header().setSectionResizeMode(3, QHeaderView.Stretch)
-        self.task_chain_tree.header().setSectionResizeMode(4, QHeaderView.Stretch)
-        self.task_chain_tree.header().setSectionResizeMode(5, QHeaderView.ResizeToContents)
-        layout.addWidget(self.task_chain_tree)
-        
-        buttons_layout = QHBoxLayout()
-        
-        add_task_btn = QPushButton("添加任务")
-        add_task_btn.clicked.connect(self.add_task)
-        buttons_layout.addWidget(add_task_btn)
-        
-        edit_task_btn = QPushButton("编辑任务")
-        edit_task_btn.clicked.connect(self.edit_task)
-        buttons_layout.addWidget(edit_task_btn)
-        
-        del_task_btn = QPushButton("删除任务")
-        del_task_btn.clicked.connect(self.delete_task)
-        buttons_layout.addWidget(del_task_btn)
-        
-        # 添加上移下移按钮
-        move_up_btn = QPushButton("上移")
-        move_up_btn.clicked.connect(self.move_task_up)
-        buttons_layout.addWidget(move_up_btn)
-        
-        move_down_btn = QPushButton("下移")
-        move_down_btn.clicked.connect(self.move_task_down)
-        buttons_layout.addWidget(move_down_btn)
-        
-        layout.addLayout(buttons_layout)
-        
-        return widget
-    
-    def create_workflow_config_tab(self):
-        """创建工作流配置标签页"""
-        widget = QWidget()
-        layout = QVBoxLayout(widget)
-        
-        self.workflow_tree = QTreeWidget()
-        self.workflow_tree.setHeaderLabels(["名称", "类型", "描述", "启用"])
-        self.workflow_tree.header().setSectionResizeMode(0, QHeaderView.ResizeToContents)
-        self.workflow_tree.header().setSectionResizeMode(1, QHeaderView.ResizeToContents)
-        self.workflow_tree.header().setSectionResizeMode(2, QHeaderView.Stretch)
-        self.workflow_tree.header().setSectionResizeMode(3, QHeaderView.ResizeToContents)
-        layout.addWidget(self.workflow_tree)
+    def create_list_editor(self, container, model_attr, model_class, view_attr, resize_modes, buttons):
+        """在容器中创建列表视图及其下方的操作按钮，模型和视图保存为对应属性"""
+        layout = QVBoxLayout(container)
+        
+        model = model_class(self)
+        if resize_modes is None:
+            view = QListView()
+            view.setUniformItemSizes(True)
+            view.setModel(model)
+        else:
+            view = create_flat_tree_view(model)
+            header = view.header()
+            for column, mode in enumerate(resize_modes):
+                header.setSectionResizeMode(column, mode)
+        setattr(self, model_attr, model)
+        setattr(self, view_attr, view)
+        layout.addWidget(view)
         
         buttons_layout = QHBoxLayout()
-        
-        add_wf_btn = QPushButton("添加工作流")
-        add_wf_btn.clicked.connect(self.add_workflow)
-        buttons_layout.addWidget(add_wf_btn)
-        
-        edit_wf_btn = QPushButton("编辑工作流")
-        edit_wf_btn.clicked.connect(self.edit_workflow)
-        buttons_layout.addWidget(edit_wf_btn)
-        
-        del_wf_btn = QPushButton("删除工作流")
-        del_wf_btn.clicked.connect(self.delete_workflow)
-        buttons_layout.addWidget(del_wf_btn)
-        
-        # 添加上移下移按钮
-        move_up_btn = QPushButton("上移")
-        move_up_btn.clicked.connect(self.move_workflow_up)
-        buttons_layout.addWidget(move_up_btn)
-        
-        move_down_btn = QPushButton("下移")
-        move_down_btn.clicked.connect(self.move_workflow_down)
-        buttons_layout.addWidget(move_down_btn)
-        
+        row_buttons = []
+        for text, handler_name in buttons:
+            button = QPushButton(text)
+            button.clicked.connect(getattr(self, handler_name))
+            buttons_layout.addWidget(button)
+            # 除添加外的操作都针对当前行
+            if not handler_name.startswith("add_"):
+                row_buttons.append(button)
         layout.addLayout(buttons_layout)
+        RowButtonsBinder(view, row_buttons)
         
-        return widget
+        return container
     
     def create_right_panel(self):
         """创建右侧面板"""
@@ -423,8 +662,12 @@ class ModernMainWindow(QMainWindow):
         log_group = QGroupBox("执行日志")
         log_layout = QVBoxLayout(log_group)
         
-        self.log_text = QTextEdit()
+        self.log_text = QPlainTextEdit()
         self.log_text.setReadOnly(True)
+        self.log_text.setMaximumBlockCount(10000)
+        self.log_text.setWordWrapMode(QTextOption.NoWrap)
+        # 追加日志专用的文档光标，创建一次后复用；文档裁剪或清空时Qt会自动调整其位置
+        self._log_cursor = QTextCursor(self.log_text.document())
         log_layout.addWidget(self.log_text)
         
         # 日志控制按钮
@@ -453,137 +696,238 @@ class ModernMainWindow(QMainWindow):
     def new_config(self):
         """新建配置"""
         # 创建示例配置
+        from src.utils.config_validator import create_sample_config
         config = create_sample_config()
         
         # 更新界面
         self.name_edit.setText(config.name)
         
-        # 清空变量列表并添加新变量
-        self.variables_tree.clear()
-        for name, value in config.variables.items():
-            item = QTreeWidgetItem([name, str(value), ""])
-            self.variables_tree.addTopLevelItem(item)
-        
-        # 清空游戏列表并添加新游戏
-        self.games_list.clear()
-        for name, game_config in config.games.items():
-            self.games_list.addItem(f"{name}: {game_config.executable}")
-        
-        # 清空工作流列表并添加新工作流
-        self.workflow_tree.clear()
-        for wf in config.workflow:
-            item = QTreeWidgetItem([wf.name, wf.type, wf.config.get('description', ''), 
-                                   "是" if wf.enabled else "否"])
-            self.workflow_tree.addTopLevelItem(item)
-        
-        # 清空脚本列表并添加新脚本
-        self.scripts_list.clear()
-        for script in config.scripts:
-            self.scripts_list.addItem(f"{script.path} ({script.type})")
+        self._populate_config(config)
         
         self.statusBar().showMessage("已创建新配置")
     
     def open_config(self):
         """打开配置文件"""
-        file_path, _ = QFileDialog.getOpenFileName(
-            self, "选择配置文件", "", "配置文件 (*.yaml *.yml *.json);;所有文件 (*)"
+        file_path = self._ask_open_path(
+            "选择配置文件", ["配置文件 (*.yaml *.yml *.json)", "所有文件 (*)"]
         )
         if file_path:
             try:
-                # 加载并验证配置
-                from src.utils.config_validator import load_and_validate_config
-                config = load_and_validate_config(file_path)
+                # 加载并验证配置（文件未修改时直接复用缓存）
+                config = self._load_config_cached(file_path)
                 
                 # 更新界面
                 self.name_edit.setText(config.name)
                 
-                # 更新变量列表
-                self.variables_tree.clear()
-                for name, value in config.variables.items():
-                    item = QTreeWidgetItem([name, str(value), ""])
-                    self.variables_tree.addTopLevelItem(item)
-                
-                # 更新游戏列表
-                self.games_list.clear()
-                for name, game_config in config.games.items():
-                    self.games_list.addItem(f"{name}: {game_config.executable}")
-                
-                # 更新工作流列表
-                self.workflow_tree.clear()
-                for wf in config.workflow:
-                    item = QTreeWidgetItem([wf.name, wf.type, wf.config.get('description', ''), 
-                                           "是" if wf.enabled else "否"])
-                    self.workflow_tree.addTopLevelItem(item)
-                
-                # 更新脚本列表
-                self.scripts_list.clear()
-                for script in config.scripts:
-                    self.scripts_list.addItem(f"{script.path} ({script.type})")
+                self._populate_config(config)
                 
                 self.statusBar().showMessage(f"已加载配置: {file_path}")
             except Exception as e:
                 QMessageBox.critical(self, "错误", f"无法加载配置文件:\n{str(e)}")
     
-    def save_config(self):
-        """保存配置"""
-        # 创建一个临时配置对象
+    def _populate_config(self, config):
+        """用配置对象批量填充变量、游戏、工作流和脚本列表"""
+        variable_entries = [
+            VariableEntry(name, str(value), "")
+            for name, value in config.variables.items()
+        ]
+        game_entries = [
+            GameEntry(name, str(game_config.executable))
+            for name, game_config in config.games.items()
+        ]
+        workflow_entries = [
+            WorkflowEntry(wf.name, wf.type, wf.config.get('description', ''), wf.enabled)
+            for wf in config.workflow
+        ]
+        script_entries = [
+            ScriptEntry(str(script.path), script.type)
+            for script in config.scripts
+        ]
+        
+        # 每个模型只重置一次
+        with bulk_update(self.variables_tree, self.games_list, self.workflow_tree, self.scripts_list):
+            self.variables_model.set_entries(variable_entries)
+            self.games_model.set_entries(game_entries)
+            self.workflow_model.set_entries(workflow_entries)
+            self.scripts_model.set_entries(script_entries)
+    
+    def _ask_open_path(self, title, name_filters):
+        """通过复用的打开对话框选择文件，取消时返回空字符串"""
+        if self._open_dialog is None:
+            self._open_dialog = QFileDialog(self)
+            self._open_dialog.setFileMode(QFileDialog.ExistingFile)
+            self._open_dialog.setAcceptMode(QFileDialog.AcceptOpen)
+        dialog = self._open_dialog
+        dialog.setWindowTitle(title)
+        dialog.setNameFilters(name_filters)
+        if dialog.exec_():
+            return dialog.selectedFiles()[0]
+        return ""
+    
+    def _prepare_save_dialog(self, title, default_name, name_filters):
+        """取得复用的保存对话框并设置标题、过滤器和默认文件名"""
+        if self._save_dialog is None:
+            self._save_dialog = QFileDialog(self)
+            self._save_dialog.setFileMode(QFileDialog.AnyFile)
+            self._save_dialog.setAcceptMode(QFileDialog.AcceptSave)
+            self._save_dialog.fileSelected.connect(self._on_save_path_selected)
+            self._save_dialog.rejected.connect(self._clear_save_path_callback)
+        dialog = self._save_dialog
+        dialog.setWindowTitle(title)
+        dialog.setNameFilters(name_filters)
+        dialog.selectFile(default_name)
+        return dialog
+    
+    def _ask_save_path(self, title, default_name, name_filters):
+        """通过复用的保存对话框选择文件，取消时返回空字符串"""
+        dialog = self._prepare_save_dialog(title, default_name, name_filters)
+        if dialog.exec_():
+            return dialog.selectedFiles()[0]
+        return ""
+    
+    def _open_save_dialog(self, title, default_name, name_filters, on_selected):
+        """以窗口模态打开复用的保存对话框，不进入嵌套事件循环，选中文件后调用on_selected(路径)"""
+        dialog = self._prepare_save_dialog(title, default_name, name_filters)
+        self._save_path_callback = on_selected
+        dialog.open()
+    
+    def _on_save_path_selected(self, file_path):
+        """保存对话框选中文件，交给_open_save_dialog登记的回调处理"""
+        callback, self._save_path_callback = self._save_path_callback, None
+        if callback is not None and file_path:
+            callback(file_path)
+    
+    def _clear_save_path_callback(self):
+        """保存对话框被取消"""
+        self._save_path_callback = None
+    
+    def _get_dialog(self, dialog_class, *values):
+        """获取复用的编辑对话框并载入要编辑的值"""
+        dialog = self._dialogs.get(dialog_class)
+        if dialog is None:
+            dialog = self._dialogs[dialog_class] = dialog_class(self)
+        dialog.load(*values)
+        return dialog
+    
+    def _show_message(self, icon, title, text):
+        """通过复用的消息框显示提示"""
+        if self._message_box is None:
+            self._message_box = QMessageBox(self)
+        box = self._message_box
+        box.setIcon(icon)
+        box.setWindowTitle(title)
+        box.setText(text)
+        box.exec_()
+    
+    def _load_config_cached(self, file_path):
+        """加载配置，按文件修改时间缓存解析结果"""
+        path = os.path.abspath(file_path)
+        stat = os.stat(path)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        cached = self._config_cache.get(path)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        
+        from src.utils.config_validator import load_and_validate_config
+        config = load_and_validate_config(path)
+        self._config_cache[path] = (stamp, config)
+        return config
+    
+    def _connect_dirty_signals(self):
+        """将配置控件的修改信号连接到缓存失效"""
+        self.name_edit.textChanged.connect(self._mark_config_dirty)
+        self.version_combo.currentTextChanged.connect(self._mark_config_dirty)
+        for section, view in (('variables', self.variables_tree), ('games', self.games_list),
+                              ('workflow', self.workflow_tree), ('scripts', self.scripts_list)):
+            invalidate = partial(self._mark_section_dirty, section)
+            model = view.model()
+            for signal in (model.dataChanged, model.rowsInserted, model.rowsRemoved,
+                           model.rowsMoved, model.modelReset, model.layoutChanged):
+                signal.connect(invalidate)
+    
+    def _mark_config_dirty(self, *args):
+        """界面配置发生变化，使缓存的配置数据和预览文本失效"""
+        self._config_dirty = True
+        self._preview_cache = None
+    
+    def _mark_section_dirty(self, section, *args):
+        """某个列表发生变化，只使该列表的分段缓存失效"""
+        self._section_cache.pop(section, None)
+        self._choices_cache.pop(section, None)
+        self._mark_config_dirty()
+    
+    def _collect_config_data(self):
+        """从界面收集配置数据，界面未修改时复用上次结果"""
+        if not self._config_dirty and self._config_data_cache is not None:
+            return self._config_data_cache
+        
+        sections = self._section_cache
+        for section, collect in (('variables', self._collect_variables), ('games', self._collect_games),
+                                 ('workflow', self._collect_workflow), ('scripts', self._collect_scripts)):
+            if section not in sections:
+                sections[section] = collect()
+        
         config_data = {
             'version': self.version_combo.currentText(),
             'name': self.name_edit.text(),
-            'variables': {},
-            'games': {},
-            'workflow': [],
-            'scripts': []
+            'variables': sections['variables'],
+            'games': sections['games'],
+            'workflow': sections['workflow'],
+            'scripts': sections['scripts']
         }
         
-        # 从界面收集变量
-        for i in range(self.variables_tree.topLevelItemCount()):
-            item = self.variables_tree.topLevelItem(i)
-            config_data['variables'][item.text(0)] = item.text(1)
-        
-        # 从界面收集游戏
-        for i in range(self.games_list.count()):
-            item_text = self.games_list.item(i).text()
-            name, path = item_text.split(': ', 1)
-            config_data['games'][name] = {'executable': path}
-        
-        # 从界面收集工作流
-        for i in range(self.workflow_tree.topLevelItemCount()):
-            item = self.workflow_tree.topLevelItem(i)
-            config_data['workflow'].append({
-                'name': item.text(0),
-                'type': item.text(1),
-                'description': item.text(2),
-                'enabled': item.text(3) == '是'
-            })
-        
-        # 从界面收集脚本
-        for i in range(self.scripts_list.count()):
-            item_text = self.scripts_list.item(i).text()
-            parts = item_text.split(' (')
-            path = parts[0]
-            script_type = parts[1][:-1] if len(parts) > 1 else 'python'
-            config_data['scripts'].append({
-                'path': path,
-                'type': script_type
-            })
+        self._config_data_cache = config_data
+        self._config_dirty = False
+        return config_data
+    
+    def _collect_variables(self):
+        """从界面收集变量"""
+        return {entry.name: entry.value for entry in self.variables_model.entries()}
+    
+    def _collect_games(self):
+        """从界面收集游戏"""
+        return {entry.name: {'executable': entry.executable} for entry in self.games_model.entries()}
+    
+    def _collect_workflow(self):
+        """从界面收集工作流"""
+        return [
+            {
+                'name': entry.name,
+                'type': entry.type,
+                'description': entry.description,
+                'enabled': entry.enabled
+            }
+            for entry in self.workflow_model.entries()
+        ]
+    
+    def _collect_scripts(self):
+        """从界面收集脚本"""
+        return [
+            {
+                'path': entry.path,
+                'type': entry.type
+            }
+            for entry in self.scripts_model.entries()
+        ]
+    
+    def save_config(self):
+        """保存配置"""
+        config_data = self._collect_config_data()
         
         # 保存配置文件
-        file_path, _ = QFileDialog.getSaveFileName(
-            self, "保存配置文件", "", "YAML文件 (*.yaml);;JSON文件 (*.json);;所有文件 (*)"
+        file_path = self._ask_save_path(
+            "保存配置文件", "", ["YAML文件 (*.yaml)", "JSON文件 (*.json)", "所有文件 (*)"]
         )
         
         if file_path:
-            import yaml
-            import json
-            
+            from src.utils.config_parser import dump_json, dump_yaml
             try:
                 if file_path.endswith('.json'):
-                    with open(file_path, 'w', encoding='utf-8') as f:
-                        json.dump(config_data, f, indent=2, ensure_ascii=False)
+                    with open(file_path, 'wb') as f:
+                        f.write(dump_json(config_data))
                 else:
                     with open(file_path, 'w', encoding='utf-8') as f:
-                        yaml.dump(config_data, f, default_flow_style=False, allow_unicode=True)
+                        dump_yaml(config_data, f)
                 
                 self.statusBar().showMessage(f"已保存配置: {file_path}")
             except Exception as e:
@@ -595,58 +939,17 @@ class ModernMainWindow(QMainWindow):
     
     def start_execution(self):
         """开始执行"""
-        if self.framework is None:
-            # 创建框架实例
-            # 由于GameAutomationFramework需要配置文件路径，我们需要先保存配置
-            temp_config_path = "temp_config.yaml"
-            
-            # 创建临时配置文件
-            config_data = {
-                'version': self.version_combo.currentText(),
-                'name': self.name_edit.text(),
-                'variables': {},
-                'games': {},
-                'workflow': [],
-                'scripts': []
-            }
-            
-            # 从界面收集变量
-            for i in range(self.variables_tree.topLevelItemCount()):
-                item = self.variables_tree.topLevelItem(i)
-                config_data['variables'][item.text(0)] = item.text(1)
-            
-            # 从界面收集游戏
-            for i in range(self.games_list.count()):
-                item_text = self.games_list.item(i).text()
-                name, path = item_text.split(': ', 1)
-                config_data['games'][name] = {'executable': path}
-            
-            # 从界面收集工作流
-            for i in range(self.workflow_tree.topLevelItemCount()):
-                item = self.workflow_tree.topLevelItem(i)
-                config_data['workflow'].append({
-                    'name': item.text(0),
-                    'type': item.text(1),
-                    'description': item.text(2),
-                    'enabled': item.text(3) == '是'
-                })
-            
-            # 从界面收集脚本
-            for i in range(self.scripts_list.count()):
-                item_text = self.scripts_list.item(i).text()
-                parts = item_text.split(' (')
-                path = parts[0]
-                script_type = parts[1][:-1] if len(parts) > 1 else 'python'
-                config_data['scripts'].append({
-                    'path': path,
-                    'type': script_type
-                })
-            
-            import yaml
-            with open(temp_config_path, 'w', encoding='utf-8') as f:
-                yaml.dump(config_data, f, default_flow_style=False, allow_unicode=True)
-            
-            self.framework = GameAutomationFramework(temp_config_path)
+        if self.execution_task and not self.execution_task.done():
+            self.statusBar().showMessage("任务正在执行中")
+            return
+        
+        # 界面配置未修改时收集结果是同一个缓存对象，可直接复用已创建的框架
+        config_data = self._collect_config_data()
+        if self.framework is None or config_data is not self._framework_config:
+            # 直接用界面上的配置数据创建框架实例，无需写入临时文件
+            from src.game_automation_framework import GameAutomationFramework
+            self.framework = GameAutomationFramework.from_dict(config_data)
+            self._framework_config = config_data
             
             # 设置回调
             self.framework.set_callbacks(
@@ -654,18 +957,51 @@ class ModernMainWindow(QMainWindow):
                 status_callback=self.update_status
             )
         
-        # 在单独线程中执行
-        self.execution_thread = ExecutionThread(self.framework)
-        self.execution_thread.start()
+        # 框架和适配器中有大量同步阻塞调用（图像识别、带duration的鼠标操作等），放到工作线程的事件循环中执行，
+        # 界面事件循环只等待其结果；取消令牌跨线程设置，使用线程安全的threading.Event
+        self._cancel_event = threading.Event()
+        self.execution_task = asyncio.wrap_future(asyncio.run_coroutine_threadsafe(
+            self.framework.run(cancel_event=self._cancel_event), self._get_worker_loop()
+        ))
+        self.execution_task.add_done_callback(self._on_execution_finished)
         
         self.statusBar().showMessage("正在执行自动化任务...")
     
+    def _get_worker_loop(self):
+        """返回运行框架的工作线程事件循环，首次使用时创建
+        
+        各次执行共用同一个循环，复用的框架实例内部的asyncio对象始终绑定在同一个循环上；
+        当前策略是QtAsyncio，它创建的循环属于主线程，因此按标准策略创建普通事件循环
+        """
+        if self._worker_loop is None:
+            self._worker_loop = asyncio.DefaultEventLoopPolicy().new_event_loop()
+            threading.Thread(
+                target=self._worker_loop.run_forever, name="ScriptZeroFramework", daemon=True
+            ).start()
+        return self._worker_loop
+    
+    def _on_execution_finished(self, task):
+        """执行任务结束回调，错误详情已由框架写入日志，这里只更新状态栏"""
+        if task.cancelled():
+            self.update_status("执行已停止")
+            return
+        error = task.exception()
+        if error is not None:
+            self.update_status(f"执行出错: {error}")
+    
     def stop_execution(self):
         """停止执行"""
-        if self.execution_thread and self.execution_thread.isRunning():
-            self.execution_thread.terminate()
-            self.execution_thread.wait()
-            self.statusBar().showMessage("执行已停止")
+        task = self.execution_task
+        if task and not task.done() and not self._cancel_event.is_set():
+            # 先设置取消令牌，让框架在下一个工作流或步骤开始前自行退出；宽限时间内仍未结束再强制取消
+            self._cancel_event.set()
+            QTimer.singleShot(self._STOP_GRACE_MS, self, partial(self._force_stop, task))
+            self.statusBar().showMessage("正在停止执行...")
+    
+    def _force_stop(self, task):
+        """宽限时间到后仍在执行时强制取消任务，取消会传递到工作线程中的框架协程"""
+        if not task.done():
+            task.cancel()
     
     def pause_execution(self):
         """暂停执行"""
@@ -680,54 +1016,16 @@ class ModernMainWindow(QMainWindow):
         
         layout = QVBoxLayout(preview_dialog)
         
-        text_edit = QTextEdit()
+        # 预览只显示纯文本，使用比QTextEdit更轻量的QPlainTextEdit
+        text_edit = QPlainTextEdit()
         text_edit.setReadOnly(True)
+        text_edit.setWordWrapMode(QTextOption.NoWrap)
         
-        # 创建临时配置数据
-        config_data = {
-            'version': self.version_combo.currentText(),
-            'name': self.name_edit.text(),
-            'variables': {},
-            'games': {},
-            'workflow': [],
-            'scripts': []
-        }
-        
-        # 从界面收集变量
-        for i in range(self.variables_tree.topLevelItemCount()):
-            item = self.variables_tree.topLevelItem(i)
-            config_data['variables'][item.text(0)] = item.text(1)
-        
-        # 从界面收集游戏
-        for i in range(self.games_list.count()):
-            item_text = self.games_list.item(i).text()
-            name, path = item_text.split(': ', 1)
-            config_data['games'][name] = {'executable': path}
-        
-        # 从界面收集工作流
-        for i in range(self.workflow_tree.topLevelItemCount()):
-            item = self.workflow_tree.topLevelItem(i)
-            config_data['workflow'].append({
-                'name': item.text(0),
-                'type': item.text(1),
-                'description': item.text(2),
-                'enabled': item.text(3) == '是'
-            })
-        
-        # 从界面收集脚本
-        for i in range(self.scripts_list.count()):
-            item_text = self.scripts_list.item(i).text()
-            parts = item_text.split(' (')
-            path = parts[0]
-            script_type = parts[1][:-1] if len(parts) > 1 else 'python'
-            config_data['scripts'].append({
-                'path': path,
-                'type': script_type
-            })
-        
-        import yaml
-        config_yaml = yaml.dump(config_data, default_flow_style=False, allow_unicode=True)
-        text_edit.setPlainText(config_yaml)
+        # 配置未修改时直接复用上次生成的预览文本
+        if self._preview_cache is None:
+            from src.utils.config_parser import dump_yaml
+            self._preview_cache = dump_yaml(self._collect_config_data())
+        text_edit.setPlainText(self._preview_cache)
         
         layout.addWidget(text_edit)
         
@@ -735,229 +1033,196 @@ class ModernMainWindow(QMainWindow):
     
     def clear_logs(self):
         """清空日志"""
+        self._log_buffer.clear()
+        self._log_flush_timer.stop()
         self.log_text.clear()
+        # 后台保存任务可能仍在读取当前文件，换用新文件而不是原地截断
+        self._log_file.close()
+        self._retired_log_paths.append(self._log_file.name)
+        self._log_file = self._new_log_file()
+        self._remove_retired_logs()
+    
+    @staticmethod
+    def _new_log_file():
+        """创建只追加写入的临时日志文件"""
+        return tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", suffix=".log", prefix="scriptzero_", delete=False
+        )
+    
+    def _remove_retired_logs(self):
+        """没有后台文件任务时删除弃用的临时日志文件"""
+        if self._file_tasks:
+            return
+        for path in self._retired_log_paths:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        self._retired_log_paths.clear()
+    
+    def _log_snapshot(self):
+        """刷新缓冲的日志，返回当前日志文件路径和已写入的字节数，后台任务只复制这部分内容"""
+        self._flush_logs()
+        return self._log_file.name, os.fstat(self._log_file.fileno()).st_size
     
     def save_logs(self):
         """保存日志"""
-        file_path, _ = QFileDialog.getSaveFileName(
-            self, "保存日志", "execution_log.txt", "文本文件 (*.txt);;所有文件 (*)"
+        self._open_save_dialog(
+            "保存日志", "execution_log.txt", ["文本文件 (*.txt)", "所有文件 (*)"], self._save_logs_to
         )
-        if file_path:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(self.log_text.toPlainText())
+    
+    def _save_logs_to(self, file_path):
+        """将日志复制到选定的文件"""
+        self._run_file_task(
+            partial(self.update_status, f"日志已保存到: {file_path}"), "保存日志失败: ",
+            write_report, file_path, "", *self._log_snapshot()
+        )
+    
+    def _run_file_task(self, on_success, error_prefix, func, *args):
+        """在后台线程执行文件操作，日志很大时也不阻塞界面，结束后回到界面线程提示结果"""
+        task = asyncio.ensure_future(asyncio.to_thread(func, *args))
+        self._file_tasks.add(task)
+        task.add_done_callback(partial(self._on_file_task_done, on_success, error_prefix))
+    
+    def _on_file_task_done(self, on_success, error_prefix, task):
+        """后台文件任务结束回调"""
+        self._file_tasks.discard(task)
+        self._remove_retired_logs()
+        if task.cancelled():
+            return
+        error = task.exception()
+        if error is not None:
+            self._show_message(QMessageBox.Critical, "错误", f"{error_prefix}{error}")
+        else:
+            on_success()
     
     def add_variable(self):
         """添加变量"""
-        dialog = VariableDialog(self)
+        dialog = self._get_dialog(VariableDialog)
         if dialog.exec_() == QDialog.Accepted:
             name, value, desc = dialog.get_values()
-            item = QTreeWidgetItem([name, value, desc])
-            self.variables_tree.addTopLevelItem(item)
+            self.variables_model.append_entry(VariableEntry(name, value, desc))
     
     def edit_variable(self):
         """编辑变量"""
-        selected = self.variables_tree.currentItem()
-        if selected:
-            current_name = selected.text(0)
-            current_value = selected.text(1)
-            current_desc = selected.text(2)
+        row = current_row(self.variables_tree)
+        if row >= 0:
+            entry = self.variables_model.entry(row)
             
-            dialog = VariableDialog(self, current_name, current_value, current_desc)
+            dialog = self._get_dialog(VariableDialog, entry.name, entry.value, entry.description)
             if dialog.exec_() == QDialog.Accepted:
                 name, value, desc = dialog.get_values()
-                selected.setText(0, name)
-                selected.setText(1, value)
-                selected.setText(2, desc)
-        else:
-            QMessageBox.warning(self, "警告", "请选择要编辑的变量")
+                self.variables_model.replace_entry(row, VariableEntry(name, value, desc))
     
     def delete_variable(self):
         """删除变量"""
-        selected = self.variables_tree.currentItem()
-        if selected:
-            self.variables_tree.takeTopLevelItem(self.variables_tree.indexOfTopLevelItem(selected))
-        else:
-            QMessageBox.warning(self, "警告", "请选择要删除的变量")
+        row = current_row(self.variables_tree)
+        if row >= 0:
+            self.variables_model.remove_entry(row)
     
     def add_game(self):
         """添加游戏"""
-        dialog = GameDialog(self)
+        dialog = self._get_dialog(GameDialog)
         if dialog.exec_() == QDialog.Accepted:
             name, executable, window_title, arguments, working_dir, priority, env_vars, timeout, close_after_completion = dialog.get_values()
-            self.games_list.addItem(f"{name}: {executable}")
+            self.games_model.append_entry(GameEntry(name, executable))
     
     def edit_game(self):
         """编辑游戏"""
-        selected_row = self.games_list.currentRow()
-        if selected_row >= 0:
-            current_text = self.games_list.item(selected_row).text()
-            parts = current_text.split(': ', 1)
-            if len(parts) == 2:
-                current_name, current_path = parts[0], parts[1]
-                
-                dialog = GameDialog(self, current_name, current_path, "", "", "", "normal", "", 3600, True)
-                if dialog.exec_() == QDialog.Accepted:
-                    name, executable, window_title, arguments, working_dir, priority, env_vars, timeout, close_after_completion = dialog.get_values()
-                    self.games_list.item(selected_row).setText(f"{name}: {executable}")
-        else:
-            QMessageBox.warning(self, "警告", "请选择要编辑的游戏")
+        row = current_row(self.games_list)
+        if row >= 0:
+            entry = self.games_model.entry(row)
+            
+            dialog = self._get_dialog(GameDialog, entry.name, entry.executable, "", "", "", "normal", "", 3600, True)
+            if dialog.exec_() == QDialog.Accepted:
+                name, executable, window_title, arguments, working_dir, priority, env_vars, timeout, close_after_completion = dialog.get_values()
+                self.games_model.replace_entry(row, GameEntry(name, executable))
     
     def delete_game(self):
         """删除游戏"""
-        selected_row = self.games_list.currentRow()
-        if selected_row >= 0:
-            self.games_list.takeItem(selected_row)
-        else:
-            QMessageBox.warning(self, "警告", "请选择要删除的游戏")
+        row = current_row(self.games_list)
+        if row >= 0:
+            self.games_model.remove_entry(row)
     
     def add_task(self):
         """添加任务链项"""
         dialog = TaskChainDialog(self, self.get_available_games(), self.get_available_scripts())
         if dialog.exec_() == QDialog.Accepted:
-            task_id, name, game, script, depends_on, enabled = dialog.get_values()
-            item = QTreeWidgetItem([task_id, name, game, script, ", ".join(depends_on) if depends_on else "", "是" if enabled else "否"])
-            self.task_chain_tree.addTopLevelItem(item)
+            self.task_chain_model.append_entry(TaskChainEntry(*dialog.get_values()))
 
     def edit_task(self):
         """编辑任务链项"""
-        selected = self.task_chain_tree.currentItem()
-        if selected:
-            task_id = selected.text(0)
-            name = selected.text(1)
-            game = selected.text(2)
-            script = selected.text(3)
-            depends_on = [x.strip() for x in selected.text(4).split(",")] if selected.text(4) != "" else []
-            enabled = selected.text(5) == "是"
+        row = current_row(self.task_chain_tree)
+        if row >= 0:
+            entry = self.task_chain_model.entry(row)
 
             dialog = TaskChainDialog(self, self.get_available_games(), self.get_available_scripts(), 
-                                   task_id, name, game, script, depends_on, enabled)
+                                   entry.id, entry.name, entry.game, entry.script, entry.depends_on, entry.enabled)
             if dialog.exec_() == QDialog.Accepted:
-                task_id, name, game, script, depends_on, enabled = dialog.get_values()
-                selected.setText(0, task_id)
-                selected.setText(1, name)
-                selected.setText(2, game)
-                selected.setText(3, script)
-                selected.setText(4, ", ".join(depends_on) if depends_on else "")
-                selected.setText(5, "是" if enabled else "否")
-        else:
-            QMessageBox.warning(self, "警告", "请选择要编辑的任务")
+                self.task_chain_model.replace_entry(row, TaskChainEntry(*dialog.get_values()))
 
     def delete_task(self):
         """删除任务链项"""
-        selected = self.task_chain_tree.currentItem()
-        if selected:
-            self.task_chain_tree.takeTopLevelItem(self.task_chain_tree.indexOfTopLevelItem(selected))
-        else:
-            QMessageBox.warning(self, "警告", "请选择要删除的任务")
+        row = current_row(self.task_chain_tree)
+        if row >= 0:
+            self.task_chain_model.remove_entry(row)
 
     def move_task_up(self):
         """上移任务"""
-        selected = self.task_chain_tree.currentItem()
-        if selected:
-            index = self.task_chain_tree.indexOfTopLevelItem(selected)
-            if index > 0:
-                # 获取当前项的值
-                values = [selected.text(i) for i in range(selected.columnCount())]
-
-                # 删除当前项
-                self.task_chain_tree.takeTopLevelItem(index)
-
-                # 在新位置插入
-                new_item = QTreeWidgetItem(values)
-                self.task_chain_tree.insertTopLevelItem(index - 1, new_item)
-
-                # 重新选择该项
-                self.task_chain_tree.setCurrentItem(new_item)
+        # 模型移动行时视图的当前项会跟随移动，无需重新选择
+        self.task_chain_model.move_up(current_row(self.task_chain_tree))
 
     def move_task_down(self):
         """下移任务"""
-        selected = self.task_chain_tree.currentItem()
-        if selected:
-            index = self.task_chain_tree.indexOfTopLevelItem(selected)
-            total_items = self.task_chain_tree.topLevelItemCount()
-
-            if index < total_items - 1:
-                # 获取当前项的值
-                values = [selected.text(i) for i in range(selected.columnCount())]
-
-                # 删除当前项
-                self.task_chain_tree.takeTopLevelItem(index)
-
-                # 在新位置插入
-                new_item = QTreeWidgetItem(values)
-                self.task_chain_tree.insertTopLevelItem(index + 1, new_item)
-
-                # 重新选择该项
-                self.task_chain_tree.setCurrentItem(new_item)
+        self.task_chain_model.move_down(current_row(self.task_chain_tree))
 
     def add_workflow(self):
         """添加工作流"""
-        dialog = WorkflowDialog(self)
+        dialog = self._get_dialog(WorkflowDialog)
         if dialog.exec_() == QDialog.Accepted:
             name, wf_type, description, enabled = dialog.get_values()
-            enabled_text = "是" if enabled else "否"
-            item = QTreeWidgetItem([name, wf_type, description, enabled_text])
-            self.workflow_tree.addTopLevelItem(item)
+            self.workflow_model.append_entry(WorkflowEntry(name, wf_type, description, enabled))
     
     def edit_workflow(self):
         """编辑工作流"""
-        selected = self.workflow_tree.currentItem()
-        if selected:
-            current_name = selected.text(0)
-            current_type = selected.text(1)
-            current_desc = selected.text(2)
-            current_enabled = selected.text(3) == "是"
+        row = current_row(self.workflow_tree)
+        if row >= 0:
+            entry = self.workflow_model.entry(row)
             
-            dialog = WorkflowDialog(self, current_name, current_type, current_desc, current_enabled)
+            dialog = self._get_dialog(WorkflowDialog, entry.name, entry.type, entry.description, entry.enabled)
             if dialog.exec_() == QDialog.Accepted:
                 name, wf_type, description, enabled = dialog.get_values()
-                enabled_text = "是" if enabled else "否"
-                selected.setText(0, name)
-                selected.setText(1, wf_type)
-                selected.setText(2, description)
-                selected.setText(3, enabled_text)
-        else:
-            QMessageBox.warning(self, "警告", "请选择要编辑的工作流")
+                self.workflow_model.replace_entry(row, WorkflowEntry(name, wf_type, description, enabled))
     
     def delete_workflow(self):
         """删除工作流"""
-        selected = self.workflow_tree.currentItem()
-        if selected:
-            self.workflow_tree.takeTopLevelItem(self.workflow_tree.indexOfTopLevelItem(selected))
-        else:
-            QMessageBox.warning(self, "警告", "请选择要删除的工作流")
+        row = current_row(self.workflow_tree)
+        if row >= 0:
+            self.workflow_model.remove_entry(row)
     
     def add_script(self):
         """添加脚本"""
-        dialog = ScriptDialog(self)
+        dialog = self._get_dialog(ScriptDialog)
         if dialog.exec_() == QDialog.Accepted:
             path, script_type, arguments, working_dir, environment_vars, timeout, completion_condition, dependencies = dialog.get_values()
-            self.scripts_list.addItem(f"{path} ({script_type})")
+            self.scripts_model.append_entry(ScriptEntry(path, script_type))
     
     def edit_script(self):
         """编辑脚本"""
-        selected_row = self.scripts_list.currentRow()
-        if selected_row >= 0:
-            current_text = self.scripts_list.item(selected_row).text()
-            parts = current_text.split(' (')
-            if len(parts) == 2:
-                current_path = parts[0]
-                current_type = parts[1][:-1]  # 移除末尾的 ')'
-                
-                dialog = ScriptDialog(self, current_path, current_type, "", "", "", 3600, "", "")
-                if dialog.exec_() == QDialog.Accepted:
-                    path, script_type, arguments, working_dir, environment_vars, timeout, completion_condition, dependencies = dialog.get_values()
-                    self.scripts_list.item(selected_row).setText(f"{path} ({script_type})")
-        else:
-            QMessageBox.warning(self, "警告", "请选择要编辑的脚本")
+        row = current_row(self.scripts_list)
+        if row >= 0:
+            entry = self.scripts_model.entry(row)
+            
+            dialog = self._get_dialog(ScriptDialog, entry.path, entry.type, "", "", "", 3600, "", "")
+            if dialog.exec_() == QDialog.Accepted:
+                path, script_type, arguments, working_dir, environment_vars, timeout, completion_condition, dependencies = dialog.get_values()
+                self.scripts_model.replace_entry(row, ScriptEntry(path, script_type))
     
     def delete_script(self):
         """删除脚本"""
-        selected_row = self.scripts_list.currentRow()
-        if selected_row >= 0:
-            self.scripts_list.takeItem(selected_row)
-        else:
-            QMessageBox.warning(self, "警告", "请选择要删除的脚本")
+        row = current_row(self.scripts_list)
+        if row >= 0:
+            self.scripts_model.remove_entry(row)
     
     def show_about(self):
         """显示关于对话框"""
@@ -968,200 +1233,250 @@ class ModernMainWindow(QMainWindow):
         )
     
     def log_message(self, message):
-        """接收日志消息"""
-        self.log_signal.message_logged.emit(message)
+        """接收日志消息，在主线程直接缓冲，其他线程以排队调用的方式交给主线程处理"""
+        if QThread.currentThread() == self.thread():
+            self.append_log(message)
+        else:
+            QMetaObject.invokeMethod(self, "append_log", Qt.QueuedConnection, Q_ARG(str, message))
     
+    @Slot(str)
     def append_log(self, message):
-        """追加日志到文本框"""
-        self.log_text.append(message)
-        
-        # 如果启用了自动滚动，则滚动到底部
-        if hasattr(self, '_auto_scroll_enabled') and self._auto_scroll_enabled:
-            cursor = self.log_text.textCursor()
-            cursor.movePosition(cursor.End)
-            self.log_text.setTextCursor(cursor)
+        """追加日志到缓冲区，由定时器批量写入文本框"""
+        self._log_buffer.append(message)
+        if not self._log_flush_timer.isActive():
+            self._log_flush_timer.start()
+    
+    def _flush_logs(self):
+        """将缓冲的日志一次性写入文本框"""
+        if not self._log_buffer:
+            return
+        chunk = "\n".join(self._log_buffer)
+        self._log_buffer.clear()
+        
+        cursor = self._log_cursor
+        cursor.movePosition(QTextCursor.End)
+        if not self.log_text.document().isEmpty():
+            cursor.insertBlock()
+        cursor.insertText(chunk)
+        
+        self._log_file.write(chunk + "\n")
+        self._log_file.flush()
+        
+        # 如果启用了自动滚动，则在本轮事件处理完后滚动到底部，多次刷新只滚动一次
+        if self._auto_scroll_enabled and not self._scroll_pending:
+            self._scroll_pending = True
+            QTimer.singleShot(0, self._scroll_log_to_end)
+    
+    def _scroll_log_to_end(self):
+        """将日志框滚动到底部"""
+        self._scroll_pending = False
+        scroll_bar = self.log_text.verticalScrollBar()
+        scroll_bar.setValue(scroll_bar.maximum())
     
     def update_status(self, status):
-        """更新状态栏"""
-        self.statusBar().showMessage(status)
+        """更新状态栏，其他线程（框架工作线程）的调用以排队调用的方式交给主线程处理"""
+        if QThread.currentThread() == self.thread():
+            self._set_pending_status(status)
+        else:
+            QMetaObject.invokeMethod(self, "_set_pending_status", Qt.QueuedConnection, Q_ARG(str, status))
+    
+    @Slot(str)
+    def _set_pending_status(self, status):
+        """记录待显示的状态栏消息，由定时器合并后显示"""
+        self._pending_status = status
+        self._status_timer.start()
+    
+    def _flush_status(self):
+        """显示最后一条待显示的状态栏消息，与当前显示内容相同时不再重绘"""
+        status_bar = self.statusBar()
+        if status_bar.currentMessage() != self._pending_status:
+            status_bar.showMessage(self._pending_status)
     
     def move_workflow_up(self):
         """上移工作流"""
-        selected = self.workflow_tree.currentItem()
-        if selected:
-            index = self.workflow_tree.indexOfTopLevelItem(selected)
-            if index > 0:
-                # 获取当前项的值
-                values = [selected.text(i) for i in range(selected.columnCount())]
-                
-                # 删除当前项
-                self.workflow_tree.takeTopLevelItem(index)
-                
-                # 在新位置插入
-                new_item = QTreeWidgetItem(values)
-                self.workflow_tree.insertTopLevelItem(index - 1, new_item)
-                
-                # 重新选择该项
-                self.workflow_tree.setCurrentItem(new_item)
+        # 模型移动行时视图的当前项会跟随移动，无需重新选择
+        self.workflow_model.move_up(current_row(self.workflow_tree))
     
     def move_workflow_down(self):
         """下移工作流"""
-        selected = self.workflow_tree.currentItem()
-        if selected:
-            index = self.workflow_tree.indexOfTopLevelItem(selected)
-            total_items = self.workflow_tree.topLevelItemCount()
-            
-            if index < total_items - 1:
-                # 获取当前项的值
-                values = [selected.text(i) for i in range(selected.columnCount())]
-                
-                # 删除当前项
-                self.workflow_tree.takeTopLevelItem(index)
-                
-                # 在新位置插入
-                new_item = QTreeWidgetItem(values)
-                self.workflow_tree.insertTopLevelItem(index + 1, new_item)
-                
-                # 重新选择该项
-                self.workflow_tree.setCurrentItem(new_item)
+        self.workflow_model.move_down(current_row(self.workflow_tree))
     
     def test_script(self):
         """测试脚本"""
-        selected_row = self.scripts_list.currentRow()
-        if selected_row >= 0:
-            item_text = self.scripts_list.item(selected_row).text()
-            parts = item_text.split(' (')
-            if len(parts) == 2:
-                script_path = parts[0]
-                script_type = parts[1][:-1]  # 移除末尾的 ')'
-                
-                # 这里可以实现脚本测试逻辑
-                QMessageBox.information(self, "测试脚本", f"正在测试脚本: {script_path} ({script_type})")
-        else:
-            QMessageBox.warning(self, "警告", "请选择要测试的脚本")
+        row = current_row(self.scripts_list)
+        if row < 0:
+            return
+        
+        entry = self.scripts_model.entry(row)
+        
+        # 这里可以实现脚本测试逻辑
+        self._show_message(QMessageBox.Information, "测试脚本", f"正在测试脚本: {entry.path} ({entry.type})")
     
     def reset_config(self):
         """重置配置"""
+        # 配置已是默认状态时无需确认和清空
+        modified = (self.variables_model.rowCount() or self.games_model.rowCount()
+                    or self.workflow_model.rowCount() or self.scripts_model.rowCount()
+                    or self.name_edit.text() != "新自动化任务"
+                    or self.version_combo.currentText() != "1.0")
+        if not modified:
+            self.statusBar().showMessage("配置已是默认")
+            return
+        
         reply = QMessageBox.question(self, "确认", "确定要重置配置吗？所有未保存的更改将丢失。", 
-                                   QMessageBox.Yes | QMessageBox.No)
+                                   self._YES_NO)
         if reply == QMessageBox.Yes:
-            # 清空所有配置
-            self.variables_tree.clear()
-            self.games_list.clear()
-            self.workflow_tree.clear()
-            self.scripts_list.clear()
-            self.name_edit.setText("新自动化任务")
-            self.version_combo.setCurrentText("1.0")
+            # 清空所有配置，整个窗口只在结束后重绘一次
+            self.setUpdatesEnabled(False)
+            try:
+                with bulk_update(self.variables_tree, self.games_list, self.workflow_tree, self.scripts_list):
+                    self.variables_model.set_entries([])
+                    self.games_model.set_entries([])
+                    self.workflow_model.set_entries([])
+                    self.scripts_model.set_entries([])
+                self.name_edit.setText("新自动化任务")
+                self.version_combo.setCurrentText("1.0")
+            finally:
+                self.setUpdatesEnabled(True)
             self.statusBar().showMessage("配置已重置")
 
+    def _section_choices(self, section):
+        """返回某个列表的(键列表, {键: 条目})，列表未修改时复用上次结果"""
+        choices = self._choices_cache.get(section)
+        if choices is None:
+            model_attr, key_attr = self._CHOICE_KEYS[section]
+            keys = []
+            by_key = {}
+            for entry in getattr(self, model_attr).entries():
+                key = getattr(entry, key_attr)
+                keys.append(key)
+                # 键重复时保留第一条，与逐行查找的结果一致
+                by_key.setdefault(key, entry)
+            choices = self._choices_cache[section] = (keys, by_key)
+        return choices
+
     def get_available_games(self):
         """获取可用的游戏列表"""
-        games = []
-        for i in range(self.games_list.count()):
-            item_text = self.games_list.item(i).text()
-            parts = item_text.split(': ', 1)
-            if len(parts) == 2:
-                game_name = parts[0]
-                games.append(game_name)
-        return games
+        return self._section_choices('games')[0]
 
     def get_available_scripts(self):
         """获取可用的脚本列表"""
-        scripts = []
-        for i in range(self.scripts_list.count()):
-            item_text = self.scripts_list.item(i).text()
-            parts = item_text.split(' (')
-            if len(parts) == 2:
-                script_path = parts[0]
-                scripts.append(script_path)
-        return scripts
+        return self._section_choices('scripts')[0]
 
     def get_game_config_details(self, game_name):
         """获取游戏配置详细信息"""
-        # 遍历游戏列表找到匹配的游戏并返回其详细信息
-        for i in range(self.games_list.count()):
-            item_text = self.games_list.item(i).text()
-            parts = item_text.split(': ', 1)
-            if len(parts) == 2 and parts[0] == game_name:
-                # 这里我们简单地返回整个文本，实际应用中可以解析更多细节
-                return f"游戏名称: {parts[0]}\n可执行文件: {parts[1]}"
-        return f"未找到游戏: {game_name}"
+        entry = self._section_choices('games')[1].get(game_name)
+        if entry is None:
+            return f"未找到游戏: {game_name}"
+        return f"游戏名称: {entry.name}\n可执行文件: {entry.executable}"
 
     def get_script_config_details(self, script_path):
         """获取脚本配置详细信息"""
-        # 遍历脚本列表找到匹配的脚本并返回其详细信息
-        for i in range(self.scripts_list.count()):
-            item_text = self.scripts_list.item(i).text()
-            parts = item_text.split(' (')
-            if len(parts) == 2 and parts[0] == script_path:
-                script_type = parts[1][:-1]  # 移除末尾的 ')'
-                return f"脚本路径: {parts[0]}\n类型: {script_type}"
-        return f"未找到脚本: {script_path}"
+        entry = self._section_choices('scripts')[1].get(script_path)
+        if entry is None:
+            return f"未找到脚本: {script_path}"
+        return f"脚本路径: {entry.path}\n类型: {entry.type}"
 
     def export_report(self):
         """导出报告"""
-        file_path, _ = QFileDialog.getSaveFileName(
-            self, "导出执行报告", "report.txt", "文本文件 (*.txt);;所有文件 (*)"
+        self._open_save_dialog(
+            "导出执行报告", "report.txt", ["文本文件 (*.txt)", "所有文件 (*)"], self._export_report_to
+        )
+    
+    def _export_report_to(self, file_path):
+        """将执行报告写入选定的文件"""
+        header = "".join((
+            "ScriptZero 执行报告\n",
+            f"生成时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n",
+            "-" * 50 + "\n",
+        ))
+        self._run_file_task(
+            partial(self._show_message, QMessageBox.Information, "成功", f"报告已导出到: {file_path}"),
+            "无法导出报告:\n", write_report, file_path, header, *self._log_snapshot()
         )
-        if file_path:
-            try:
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write("ScriptZero 执行报告\n")
-                    f.write(f"生成时间: {__import__('datetime').datetime.now()}\n")
-                    f.write("-" * 50 + "\n")
-                    f.write(self.log_text.toPlainText())
-                
-                QMessageBox.information(self, "成功", f"报告已导出到: {file_path}")
-            except Exception as e:
-                QMessageBox.critical(self, "错误", f"无法导出报告:\n{str(e)}")
     
     def toggle_auto_scroll(self, checked):
         """切换自动滚动"""
         self._auto_scroll_enabled = checked
-        status = "开启" if checked else "关闭"
-        self.statusBar().showMessage(f"自动滚动已{status}")
+        self.update_status(self._AUTO_SCROLL_MSG[checked])
+    
+    def closeEvent(self, event):
+        """关闭窗口时清理临时日志文件"""
+        self._log_file.close()
+        for path in (*self._retired_log_paths, self._log_file.name):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        super().closeEvent(event)
+
+
+class ConfigDialog(QDialog):
+    """配置编辑对话框基类，通过sizeHint给出默认大小，无需在构造后再调整窗口尺寸"""
+    DEFAULT_SIZE = QSize(400, 300)
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._dir_dialog = None
+    
+    def sizeHint(self):
+        return self.DEFAULT_SIZE
+    
+    def ask_directory(self, title):
+        """选择目录，目录对话框创建一次后重复使用，返回所选路径或空字符串"""
+        dialog = self._dir_dialog
+        if dialog is None:
+            dialog = self._dir_dialog = QFileDialog(self)
+            dialog.setFileMode(QFileDialog.Directory)
+            dialog.setOption(QFileDialog.ShowDirsOnly)
+        dialog.setWindowTitle(title)
+        return dialog.selectedFiles()[0] if dialog.exec_() else ""
 
 
-class VariableDialog(QDialog):
+class VariableDialog(ConfigDialog):
     """变量编辑对话框"""
+    DEFAULT_SIZE = QSize(400, 200)
+    
     def __init__(self, parent=None, name="", value="", description=""):
         super().__init__(parent)
         self.setWindowTitle("编辑变量")
-        self.resize(400, 200)
         
         layout = QFormLayout(self)
         
-        self.name_edit = QLineEdit(name)
-        self.value_edit = QLineEdit(value)
-        self.desc_edit = QLineEdit(description)
+        self.name_edit = QLineEdit()
+        self.value_edit = QLineEdit()
+        self.desc_edit = QLineEdit()
         
         layout.addRow("变量名:", self.name_edit)
         layout.addRow("值:", self.value_edit)
         layout.addRow("描述:", self.desc_edit)
         
         # 按钮
-        buttons_layout = QHBoxLayout()
-        ok_btn = QPushButton("确定")
-        ok_btn.clicked.connect(self.accept)
-        cancel_btn = QPushButton("取消")
-        cancel_btn.clicked.connect(self.reject)
-        
-        buttons_layout.addWidget(ok_btn)
-        buttons_layout.addWidget(cancel_btn)
+        layout.addRow(create_ok_cancel_buttons(self))
         
-        layout.addRow(buttons_layout)
+        self.load(name, value, description)
+    
+    def load(self, name="", value="", description=""):
+        """载入要编辑的值，便于复用同一个对话框"""
+        self.name_edit.setText(name)
+        self.value_edit.setText(value)
+        self.desc_edit.setText(description)
     
     def get_values(self):
         """获取输入的值"""
         return self.name_edit.text(), self.value_edit.text(), self.desc_edit.text()
 
 
-class GameDialog(QDialog):
+class GameDialog(ConfigDialog):
     """游戏配置对话框"""
+    DEFAULT_SIZE = QSize(600, 500)
+    
     def __init__(self, parent=None, name="", executable="", window_title="", arguments="", working_dir="", priority="normal", environment_vars="", timeout=3600, close_after_completion=True):
         super().__init__(parent)
         self.setWindowTitle("编辑游戏")
-        self.resize(600, 500)
+        
+        # 文件选择对话框，首次浏览时创建
+        self._file_dialog = None
         
         layout = QVBoxLayout(self)
         
@@ -1169,8 +1484,8 @@ class GameDialog(QDialog):
         basic_group = QGroupBox("基本配置")
         basic_layout = QFormLayout(basic_group)
         
-        self.name_edit = QLineEdit(name)
-        self.executable_edit = QLineEdit(executable)
+        self.name_edit = QLineEdit()
+        self.executable_edit = QLineEdit()
         browse_btn = QPushButton("浏览")
         browse_btn.clicked.connect(self.browse_executable)
         
@@ -1178,7 +1493,7 @@ class GameDialog(QDialog):
         executable_layout.addWidget(self.executable_edit)
         executable_layout.addWidget(browse_btn)
         
-        self.window_title_edit = QLineEdit(window_title)
+        self.window_title_edit = QLineEdit()
         
         basic_layout.addRow("游戏名称:", self.name_edit)
         basic_layout.addRow("可执行文件:", executable_layout)
@@ -1187,17 +1502,16 @@ class GameDialog(QDialog):
         layout.addWidget(basic_group)
         
         # 高级选项组
-        advanced_group = QGroupBox("高级选项")
-        advanced_group.setCheckable(True)  # 可折叠
-        advanced_group.setChecked(False)   # 默认折叠
-        advanced_layout = QFormLayout(advanced_group)
+        self.advanced_group = QGroupBox("高级选项")
+        self.advanced_group.setCheckable(True)  # 可折叠
+        advanced_layout = QFormLayout(self.advanced_group)
         
         # 启动参数
-        self.arguments_edit = QLineEdit(arguments)
+        self.arguments_edit = QLineEdit()
         advanced_layout.addRow("启动参数:", self.arguments_edit)
         
         # 工作目录
-        self.working_dir_edit = QLineEdit(working_dir)
+        self.working_dir_edit = QLineEdit()
         working_dir_btn = QPushButton("浏览")
         working_dir_btn.clicked.connect(self.browse_working_dir)
         
@@ -1209,49 +1523,54 @@ class GameDialog(QDialog):
         # 优先级
         self.priority_combo = QComboBox()
         self.priority_combo.addItems(["low", "normal", "high", "realtime"])
-        self.priority_combo.setCurrentText(priority)
         advanced_layout.addRow("进程优先级:", self.priority_combo)
         
         # 环境变量
-        self.environment_vars_edit = QLineEdit(environment_vars)
+        self.environment_vars_edit = QLineEdit()
         advanced_layout.addRow("环境变量:", self.environment_vars_edit)
         
         # 超时设置
         self.timeout_spinbox = QSpinBox()
         self.timeout_spinbox.setRange(1, 86400)  # 1秒到24小时
-        self.timeout_spinbox.setValue(timeout)
         advanced_layout.addRow("超时时间(秒):", self.timeout_spinbox)
         
         # 完成后关闭
         self.close_after_completion_check = QCheckBox()
-        self.close_after_completion_check.setChecked(close_after_completion)
         advanced_layout.addRow("完成后关闭:", self.close_after_completion_check)
         
-        layout.addWidget(advanced_group)
+        layout.addWidget(self.advanced_group)
         
         # 按钮
-        buttons_layout = QHBoxLayout()
-        ok_btn = QPushButton("确定")
-        ok_btn.clicked.connect(self.accept)
-        cancel_btn = QPushButton("取消")
-        cancel_btn.clicked.connect(self.reject)
+        layout.addWidget(create_ok_cancel_buttons(self))
         
-        buttons_layout.addWidget(ok_btn)
-        buttons_layout.addWidget(cancel_btn)
-        
-        layout.addLayout(buttons_layout)
+        self.load(name, executable, window_title, arguments, working_dir, priority,
+                  environment_vars, timeout, close_after_completion)
+    
+    def load(self, name="", executable="", window_title="", arguments="", working_dir="", priority="normal", environment_vars="", timeout=3600, close_after_completion=True):
+        """载入要编辑的值，便于复用同一个对话框"""
+        self.name_edit.setText(name)
+        self.executable_edit.setText(executable)
+        self.window_title_edit.setText(window_title)
+        self.advanced_group.setChecked(False)   # 默认折叠
+        self.arguments_edit.setText(arguments)
+        self.working_dir_edit.setText(working_dir)
+        select_combo_text(self.priority_combo, priority)
+        self.environment_vars_edit.setText(environment_vars)
+        self.timeout_spinbox.setValue(timeout)
+        self.close_after_completion_check.setChecked(close_after_completion)
     
     def browse_executable(self):
         """浏览可执行文件"""
-        file_path, _ = QFileDialog.getOpenFileName(
-            self, "选择可执行文件", "", "可执行文件 (*.exe);;所有文件 (*)"
-        )
-        if file_path:
-            self.executable_edit.setText(file_path)
+        if self._file_dialog is None:
+            self._file_dialog = QFileDialog(self, "选择可执行文件")
+            self._file_dialog.setFileMode(QFileDialog.ExistingFile)
+            self._file_dialog.setNameFilters(["可执行文件 (*.exe)", "所有文件 (*)"])
+        if self._file_dialog.exec_():
+            self.executable_edit.setText(self._file_dialog.selectedFiles()[0])
     
     def browse_working_dir(self):
         """浏览工作目录"""
-        dir_path = QFileDialog.getExistingDirectory(self, "选择工作目录", "")
+        dir_path = self.ask_directory("选择工作目录")
         if dir_path:
             self.working_dir_edit.setText(dir_path)
     
@@ -1270,12 +1589,13 @@ class GameDialog(QDialog):
         )
 
 
-class WorkflowDialog(QDialog):
+class WorkflowDialog(ConfigDialog):
     """工作流配置对话框"""
+    DEFAULT_SIZE = QSize(800, 600)
+    
     def __init__(self, parent=None, name="", wf_type="", description="", enabled=True, error_handling="continue", tasks=None):
         super().__init__(parent)
         self.setWindowTitle("编辑工作流")
-        self.resize(800, 600)
         
         layout = QVBoxLayout(self)
         
@@ -1283,13 +1603,11 @@ class WorkflowDialog(QDialog):
         basic_group = QGroupBox("基本配置")
         basic_layout = QFormLayout(basic_group)
         
-        self.name_edit = QLineEdit(name)
+        self.name_edit = QLineEdit()
         self.type_combo = QComboBox()
-        self.type_combo.addItems(["script_chain", "game", "task_chain", "mixed"])
-        self.type_combo.setCurrentText(wf_type)
-        self.desc_edit = QLineEdit(description)
+        self.type_combo.addItems(_WF_TYPES)
+        self.desc_edit = QLineEdit()
         self.enabled_check = QCheckBox()
-        self.enabled_check.setChecked(enabled)
         
         basic_layout.addRow("名称:", self.name_edit)
         basic_layout.addRow("类型:", self.type_combo)
@@ -1298,9 +1616,52 @@ class WorkflowDialog(QDialog):
         
         layout.addWidget(basic_group)
         
-        # 任务链配置组 - 仅在类型为task_chain时显示
+        # 任务链配置组 - 仅在类型为task_chain时显示，首次切换到该类型时才创建
+        # 任务数据保存在模型中，未创建配置组时也能载入和读取
+        self.tasks_model = TaskChainModel(self)
+        self.task_chain_group = None
+        self._error_handling = error_handling
+        
+        # 连接类型变化信号，按下标比较，无需每次转换类型文字
+        self.type_combo.currentIndexChanged.connect(self.on_type_changed)
+        
+        # 按钮
+        layout.addWidget(create_ok_cancel_buttons(self))
+        
+        self.load(name, wf_type, description, enabled, error_handling, tasks)
+    
+    def load(self, name="", wf_type="", description="", enabled=True, error_handling="continue", tasks=None):
+        """载入要编辑的值，便于复用同一个对话框"""
+        self.name_edit.setText(name)
+        select_combo_text(self.type_combo, wf_type)
+        self.desc_edit.setText(description)
+        self.enabled_check.setChecked(enabled)
+        self._error_handling = error_handling
+        if self.task_chain_group is not None:
+            select_combo_text(self.error_handling_combo, error_handling)
+        entries = [
+            TaskChainEntry(task['id'], task['name'], task['game'], task['script'],
+                           list(task.get('depends_on', ())), task.get('enabled', True))
+            for task in tasks or ()
+        ]
+        if self.task_chain_group is None:
+            self.tasks_model.set_entries(entries)
+        else:
+            with bulk_update(self.tasks_tree):
+                self.tasks_model.set_entries(entries)
+        self.on_type_changed(self.type_combo.currentIndex())
+    
+    def on_type_changed(self, type_index):
+        """当工作流类型改变时"""
+        is_task_chain = type_index == _TASK_CHAIN_INDEX
+        if is_task_chain and self.task_chain_group is None:
+            self._create_task_chain_group()
+        if self.task_chain_group is not None:
+            self.task_chain_group.setVisible(is_task_chain)
+    
+    def _create_task_chain_group(self):
+        """创建任务链配置组"""
         self.task_chain_group = QGroupBox("任务链配置")
-        self.task_chain_group.setVisible(wf_type == "task_chain")
         task_chain_layout = QVBoxLayout(self.task_chain_group)
         
         # 错误处理策略
@@ -1308,18 +1669,17 @@ class WorkflowDialog(QDialog):
         error_handling_layout.addWidget(QLabel("错误处理:"))
         self.error_handling_combo = QComboBox()
         self.error_handling_combo.addItems(["continue", "stop", "retry"])
-        self.error_handling_combo.setCurrentText(error_handling)
         error_handling_layout.addWidget(self.error_handling_combo)
         error_handling_layout.addStretch()
         task_chain_layout.addLayout(error_handling_layout)
         
-        # 任务列表
-        self.tasks_tree = QTreeWidget()
-        self.tasks_tree.setHeaderLabels(["ID", "名称", "游戏", "脚本", "依赖项", "启用"])
-        self.tasks_tree.header().setSectionResizeMode(0, QHeaderView.ResizeToContents)
-        self.tasks_tree.header().setSectionResizeMode(1, QHeaderView.ResizeToContents)
-        self.tasks_tree.header().setSectionResizeMode(2, QHeaderView.ResizeToContents)
-        self.tasks_tree.header().setSectionResizeMode(3, QHeaderView.Stretch)
+        # 任务列表，前三列只在整体载入时按内容调整一次宽度
+        self.tasks_tree = create_flat_tree_view(self.tasks_model)
+        header = self.tasks_tree.header()
+        for column in range(3):
+            header.setSectionResizeMode(column, QHeaderView.Interactive)
+            self.tasks_tree.resizeColumnToContents(column)
+        header.setSectionResizeMode(3, QHeaderView.Stretch)
         
         task_chain_layout.addWidget(self.tasks_tree)
         
@@ -1342,110 +1702,47 @@ class WorkflowDialog(QDialog):
         task_buttons_layout.addWidget(self.move_up_btn)
         task_buttons_layout.addWidget(self.move_down_btn)
         task_buttons_layout.addStretch()
+        RowButtonsBinder(self.tasks_tree, (self.edit_task_btn, self.delete_task_btn,
+                                           self.move_up_btn, self.move_down_btn))
         
         task_chain_layout.addLayout(task_buttons_layout)
         
-        layout.addWidget(self.task_chain_group)
-        
-        # 连接类型变化信号
-        self.type_combo.currentTextChanged.connect(self.on_type_changed)
-        
-        # 按钮
-        buttons_layout = QHBoxLayout()
-        ok_btn = QPushButton("确定")
-        ok_btn.clicked.connect(self.accept)
-        cancel_btn = QPushButton("取消")
-        cancel_btn.clicked.connect(self.reject)
-        
-        buttons_layout.addWidget(ok_btn)
-        buttons_layout.addWidget(cancel_btn)
-        
-        layout.addLayout(buttons_layout)
-    
-    def on_type_changed(self, current_type):
-        """当工作流类型改变时"""
-        is_task_chain = current_type == "task_chain"
-        self.task_chain_group.setVisible(is_task_chain)
+        select_combo_text(self.error_handling_combo, self._error_handling)
+        # 插入到底部确定/取消按钮之前
+        layout = self.layout()
+        layout.insertWidget(layout.count() - 1, self.task_chain_group)
     
     def add_task(self):
         """添加任务"""
         dialog = TaskChainDialog(self, self.get_available_games(), self.get_available_scripts())
         if dialog.exec_() == QDialog.Accepted:
-            task_id, name, game, script, depends_on, enabled = dialog.get_values()
-            item = QTreeWidgetItem([task_id, name, game, script, ", ".join(depends_on) if depends_on else "", "是" if enabled else "否"])
-            self.tasks_tree.addTopLevelItem(item)
+            self.tasks_model.append_entry(TaskChainEntry(*dialog.get_values()))
     
     def edit_task(self):
         """编辑任务"""
-        selected = self.tasks_tree.currentItem()
-        if selected:
-            task_id = selected.text(0)
-            name = selected.text(1)
-            game = selected.text(2)
-            script = selected.text(3)
-            depends_on = [x.strip() for x in selected.text(4).split(",")] if selected.text(4) != "" else []
-            enabled = selected.text(5) == "是"
+        row = current_row(self.tasks_tree)
+        if row >= 0:
+            entry = self.tasks_model.entry(row)
             
             dialog = TaskChainDialog(self, self.get_available_games(), self.get_available_scripts(), 
-                                   task_id, name, game, script, depends_on, enabled)
+                                   entry.id, entry.name, entry.game, entry.script, entry.depends_on, entry.enabled)
             if dialog.exec_() == QDialog.Accepted:
-                task_id, name, game, script, depends_on, enabled = dialog.get_values()
-                selected.setText(0, task_id)
-                selected.setText(1, name)
-                selected.setText(2, game)
-                selected.setText(3, script)
-                selected.setText(4, ", ".join(depends_on) if depends_on else "")
-                selected.setText(5, "是" if enabled else "否")
-        else:
-            QMessageBox.warning(self, "警告", "请选择要编辑的任务")
+                self.tasks_model.replace_entry(row, TaskChainEntry(*dialog.get_values()))
     
     def delete_task(self):
         """删除任务"""
-        selected = self.tasks_tree.currentItem()
-        if selected:
-            self.tasks_tree.takeTopLevelItem(self.tasks_tree.indexOfTopLevelItem(selected))
-        else:
-            QMessageBox.warning(self, "警告", "请选择要删除的任务")
+        row = current_row(self.tasks_tree)
+        if row >= 0:
+            self.tasks_model.remove_entry(row)
     
     def move_task_up(self):
         """上移任务"""
-        selected = self.tasks_tree.currentItem()
-        if selected:
-            index = self.tasks_tree.indexOfTopLevelItem(selected)
-            if index > 0:
-                # 获取当前项的值
-                values = [selected.text(i) for i in range(selected.columnCount())]
-                
-                # 删除当前项
-                self.tasks_tree.takeTopLevelItem(index)
-                
-                # 在新位置插入
-                new_item = QTreeWidgetItem(values)
-                self.tasks_tree.insertTopLevelItem(index - 1, new_item)
-                
-                # 重新选择该项
-                self.tasks_tree.setCurrentItem(new_item)
+        # 模型移动行时视图的当前项会跟随移动，无需重新选择
+        self.tasks_model.move_up(current_row(self.tasks_tree))
     
     def move_task_down(self):
         """下移任务"""
-        selected = self.tasks_tree.currentItem()
-        if selected:
-            index = self.tasks_tree.indexOfTopLevelItem(selected)
-            total_items = self.tasks_tree.topLevelItemCount()
-            
-            if index < total_items - 1:
-                # 获取当前项的值
-                values = [selected.text(i) for i in range(selected.columnCount())]
-                
-                # 删除当前项
-                self.tasks_tree.takeTopLevelItem(index)
-                
-                # 在新位置插入
-                new_item = QTreeWidgetItem(values)
-                self.tasks_tree.insertTopLevelItem(index + 1, new_item)
-                
-                # 重新选择该项
-                self.tasks_tree.setCurrentItem(new_item)
+        self.tasks_model.move_down(current_row(self.tasks_tree))
     
     def get_available_games(self):
         """获取可用的游戏列表 - 需要从父窗口获取"""
@@ -1461,36 +1758,38 @@ class WorkflowDialog(QDialog):
     
     def get_values(self):
         """获取输入的值"""
-        tasks = []
-        for i in range(self.tasks_tree.topLevelItemCount()):
-            item = self.tasks_tree.topLevelItem(i)
-            depends_on = [x.strip() for x in item.text(4).split(",")] if item.text(4) != "" else []
-            task = {
-                'id': item.text(0),
-                'name': item.text(1),
-                'game': item.text(2),
-                'script': item.text(3),
-                'depends_on': depends_on,
-                'enabled': item.text(5) == "是"
+        tasks = [
+            {
+                'id': entry.id,
+                'name': entry.name,
+                'game': entry.game,
+                'script': entry.script,
+                'depends_on': list(entry.depends_on),
+                'enabled': entry.enabled
             }
-            tasks.append(task)
+            for entry in self.tasks_model.entries()
+        ]
         
         return (
             self.name_edit.text(), 
             self.type_combo.currentText(), 
             self.desc_edit.text(), 
             self.enabled_check.isChecked(),
-            self.error_handling_combo.currentText(),
+            self.error_handling_combo.currentText() if self.task_chain_group is not None else self._error_handling,
             tasks
         )
 
 
-class ScriptDialog(QDialog):
+class ScriptDialog(ConfigDialog):
     """脚本配置对话框"""
-    def __init__(self, parent=None, path="", script_type="python", arguments="", working_dir="", environment_vars="", timeout=3600, completion_condition="", dependencies=None):
+    DEFAULT_SIZE = QSize(600, 500)
+    
+    def __init__(self, parent=None, path="", script_type="python", arguments="", working_dir="", environment_vars="", timeout=3600, completion_condition="", dependencies=""):
         super().__init__(parent)
         self.setWindowTitle("编辑脚本")
-        self.resize(600, 500)
+        
+        # 文件选择对话框，首次浏览时创建
+        self._file_dialog = None
         
         layout = QVBoxLayout(self)
         
@@ -1498,7 +1797,7 @@ class ScriptDialog(QDialog):
         basic_group = QGroupBox("基本配置")
         basic_layout = QFormLayout(basic_group)
         
-        self.path_edit = QLineEdit(path)
+        self.path_edit = QLineEdit()
         browse_btn = QPushButton("浏览")
         browse_btn.clicked.connect(self.browse_script)
         
@@ -1507,8 +1806,7 @@ class ScriptDialog(QDialog):
         path_layout.addWidget(browse_btn)
         
         self.type_combo = QComboBox()
-        self.type_combo.addItems(["python", "exe", "bat", "ps1", "ahk"])
-        self.type_combo.setCurrentText(script_type)
+        self.type_combo.addItems(_SCRIPT_TYPES)
         
         basic_layout.addRow("脚本路径:", path_layout)
         basic_layout.addRow("类型:", self.type_combo)
@@ -1516,17 +1814,16 @@ class ScriptDialog(QDialog):
         layout.addWidget(basic_group)
         
         # 高级选项组
-        advanced_group = QGroupBox("高级选项")
-        advanced_group.setCheckable(True)  # 可折叠
-        advanced_group.setChecked(False)   # 默认折叠
-        advanced_layout = QFormLayout(advanced_group)
+        self.advanced_group = QGroupBox("高级选项")
+        self.advanced_group.setCheckable(True)  # 可折叠
+        advanced_layout = QFormLayout(self.advanced_group)
         
         # 参数
-        self.arguments_edit = QLineEdit(arguments)
+        self.arguments_edit = QLineEdit()
         advanced_layout.addRow("参数:", self.arguments_edit)
         
         # 工作目录
-        self.working_dir_edit = QLineEdit(working_dir)
+        self.working_dir_edit = QLineEdit()
         working_dir_btn = QPushButton("浏览")
         working_dir_btn.clicked.connect(self.browse_working_dir)
         
@@ -1536,49 +1833,54 @@ class ScriptDialog(QDialog):
         advanced_layout.addRow("工作目录:", working_dir_layout)
         
         # 环境变量
-        self.environment_vars_edit = QLineEdit(environment_vars)
+        self.environment_vars_edit = QLineEdit()
         advanced_layout.addRow("环境变量:", self.environment_vars_edit)
         
         # 超时设置
         self.timeout_spinbox = QSpinBox()
         self.timeout_spinbox.setRange(1, 86400)  # 1秒到24小时
-        self.timeout_spinbox.setValue(timeout)
         advanced_layout.addRow("超时时间(秒):", self.timeout_spinbox)
         
         # 完成条件
-        self.completion_condition_edit = QLineEdit(completion_condition)
+        self.completion_condition_edit = QLineEdit()
         advanced_layout.addRow("完成条件:", self.completion_condition_edit)
         
         # 依赖项
-        self.dependencies_edit = QLineEdit(dependencies if dependencies else "")
+        self.dependencies_edit = QLineEdit()
         advanced_layout.addRow("依赖项:", self.dependencies_edit)
         
-        layout.addWidget(advanced_group)
+        layout.addWidget(self.advanced_group)
         
         # 按钮
-        buttons_layout = QHBoxLayout()
-        ok_btn = QPushButton("确定")
-        ok_btn.clicked.connect(self.accept)
-        cancel_btn = QPushButton("取消")
-        cancel_btn.clicked.connect(self.reject)
-        
-        buttons_layout.addWidget(ok_btn)
-        buttons_layout.addWidget(cancel_btn)
+        layout.addWidget(create_ok_cancel_buttons(self))
         
-        layout.addLayout(buttons_layout)
+        self.load(path, script_type, arguments, working_dir, environment_vars, timeout,
+                  completion_condition, dependencies)
+    
+    def load(self, path="", script_type="python", arguments="", working_dir="", environment_vars="", timeout=3600, completion_condition="", dependencies=""):
+        """载入要编辑的值，便于复用同一个对话框"""
+        self.path_edit.setText(path)
+        select_combo_text(self.type_combo, script_type)
+        self.advanced_group.setChecked(False)   # 默认折叠
+        self.arguments_edit.setText(arguments)
+        self.working_dir_edit.setText(working_dir)
+        self.environment_vars_edit.setText(environment_vars)
+        self.timeout_spinbox.setValue(timeout)
+        self.completion_condition_edit.setText(completion_condition)
+        self.dependencies_edit.setText(dependencies or "")
     
     def browse_script(self):
         """浏览脚本文件"""
-        file_path, _ = QFileDialog.getOpenFileName(
-            self, "选择脚本文件", "", 
-            "Python文件 (*.py);;可执行文件 (*.exe);;批处理文件 (*.bat);;PowerShell文件 (*.ps1);;AutoHotkey文件 (*.ahk);;所有文件 (*)"
-        )
-        if file_path:
-            self.path_edit.setText(file_path)
+        if self._file_dialog is None:
+            self._file_dialog = QFileDialog(self, "选择脚本文件")
+            self._file_dialog.setFileMode(QFileDialog.ExistingFile)
+            self._file_dialog.setNameFilters(_SCRIPT_FILTERS)
+        if self._file_dialog.exec_():
+            self.path_edit.setText(self._file_dialog.selectedFiles()[0])
     
     def browse_working_dir(self):
         """浏览工作目录"""
-        dir_path = QFileDialog.getExistingDirectory(self, "选择工作目录", "")
+        dir_path = self.ask_directory("选择工作目录")
         if dir_path:
             self.working_dir_edit.setText(dir_path)
     
@@ -1596,16 +1898,13 @@ class ScriptDialog(QDialog):
         )
 
 
-class TaskChainDialog(QDialog):
+class TaskChainDialog(ConfigDialog):
     """任务链配置对话框"""
-    def __init__(self, parent=None, available_games=None, available_scripts=None, task_id="", name="", game="", script="", depends_on=None, enabled=True):
+    DEFAULT_SIZE = QSize(800, 600)
+    
+    def __init__(self, parent=None, available_games=(), available_scripts=(), task_id="", name="", game="", script="", depends_on=(), enabled=True):
         super().__init__(parent)
         self.setWindowTitle("编辑任务链项")
-        self.resize(800, 600)
-        
-        available_games = available_games or []
-        available_scripts = available_scripts or []
-        depends_on = depends_on or []
         
         layout = QVBoxLayout(self)
         
@@ -1617,15 +1916,13 @@ class TaskChainDialog(QDialog):
         
         # 游戏下拉列表
         self.game_combo = QComboBox()
-        for game in available_games:
-            self.game_combo.addItem(game)
+        self.game_combo.addItems(available_games)
         if game:
             self.game_combo.setCurrentText(game)
         
         # 脚本下拉列表
         self.script_combo = QComboBox()
-        for script in available_scripts:
-            self.script_combo.addItem(script)
+        self.script_combo.addItems(available_scripts)
         if script:
             self.script_combo.setCurrentText(script)
         
@@ -1634,15 +1931,15 @@ class TaskChainDialog(QDialog):
         self.depends_list.setSelectionMode(QAbstractItemView.MultiSelection)
         
         # 添加所有可用任务到依赖项列表（游戏和脚本）
-        all_tasks = list(set(available_games + available_scripts))  # 合并并去重
-        for task in all_tasks:
-            self.depends_list.addItem(QListWidgetItem(task))
+        # 合并并去重，保持原有顺序，每次打开时行顺序一致
+        all_tasks = list(dict.fromkeys((*available_games, *available_scripts)))
+        self.depends_list.addItems(all_tasks)
         
-        # 查找当前依赖项并选中
-        for i in range(self.depends_list.count()):
-            item = self.depends_list.item(i)
-            if item.text() in depends_on:
-                item.setSelected(True)
+        # 选中当前依赖项，直接按候选列表的下标定位行，不再逐行读取文字
+        depends_set = frozenset(depends_on)
+        for row, task in enumerate(all_tasks):
+            if task in depends_set:
+                self.depends_list.item(row).setSelected(True)
         
         self.enabled_check = QCheckBox()
         self.enabled_check.setChecked(enabled)
@@ -1679,21 +1976,23 @@ class TaskChainDialog(QDialog):
         
         layout.addWidget(details_group)
         
-        # 连接信号以显示详情
-        self.game_combo.currentTextChanged.connect(self.show_game_details)
-        self.script_combo.currentTextChanged.connect(self.show_script_details)
+        # 父窗口的详情查询方法只查找一次，候选项直接使用传入的列表
+        parent = self.parent()
+        self._game_details = getattr(parent, 'get_game_config_details', None)
+        self._script_details = getattr(parent, 'get_script_config_details', None)
+        self._game_choices = frozenset(available_games)
+        self._script_choices = frozenset(available_scripts)
+        
+        # 连接信号以显示详情，快速连续切换时合并为停止切换后的一次刷新
+        self._details_timer = QTimer(self)
+        self._details_timer.setSingleShot(True)
+        self._details_timer.setInterval(150)
+        self._details_timer.timeout.connect(self._refresh_details)
+        self.game_combo.currentTextChanged.connect(self._schedule_details)
+        self.script_combo.currentTextChanged.connect(self._schedule_details)
         
         # 按钮
-        buttons_layout = QHBoxLayout()
-        ok_btn = QPushButton("确定")
-        ok_btn.clicked.connect(self.accept)
-        cancel_btn = QPushButton("取消")
-        cancel_btn.clicked.connect(self.reject)
-        
-        buttons_layout.addWidget(ok_btn)
-        buttons_layout.addWidget(cancel_btn)
-        
-        layout.addLayout(buttons_layout)
+        layout.addWidget(create_ok_cancel_buttons(self))
         
         # 显示初始详情
         if game:
@@ -1701,42 +2000,41 @@ class TaskChainDialog(QDialog):
         if script:
             self.show_script_details(script)
     
+    def _schedule_details(self, *args):
+        """下拉框选择变化，重新开始计时，计时结束后刷新详情"""
+        self._details_timer.start()
+    
+    def _refresh_details(self):
+        """按当前选择刷新游戏和脚本详情"""
+        self.show_game_details(self.game_combo.currentText())
+        self.show_script_details(self.script_combo.currentText())
+    
     def show_game_details(self, game_name):
         """显示游戏详细信息"""
-        if game_name and hasattr(self.parent(), 'get_game_config_details'):
-            details = self.parent().get_game_config_details(game_name)
-            self.game_details_text.setPlainText(details)
+        if game_name and self._game_details is not None:
+            self.game_details_text.setPlainText(self._game_details(game_name))
+        elif game_name in self._game_choices:
+            # 父窗口无法提供详情时显示简单的占位符信息
+            self.game_details_text.setPlainText(f"游戏: {game_name}\n状态: 已配置")
         else:
-            # 尝试从父窗口获取游戏列表，然后显示相关信息
-            games_list = self.parent().get_available_games() if hasattr(self.parent(), 'get_available_games') else []
-            if game_name in games_list:
-                # 显示简单的占位符信息
-                self.game_details_text.setPlainText(f"游戏: {game_name}\n状态: 已配置")
-            else:
-                self.game_details_text.setPlainText("未选择或未找到该游戏配置")
+            self.game_details_text.setPlainText("未选择或未找到该游戏配置")
     
     def show_script_details(self, script_path):
         """显示脚本详细信息"""
-        if script_path and hasattr(self.parent(), 'get_script_config_details'):
-            details = self.parent().get_script_config_details(script_path)
-            self.script_details_text.setPlainText(details)
+        if script_path and self._script_details is not None:
+            self.script_details_text.setPlainText(self._script_details(script_path))
+        elif script_path in self._script_choices:
+            # 父窗口无法提供详情时显示简单的占位符信息
+            self.script_details_text.setPlainText(f"脚本: {script_path}\n状态: 已配置")
         else:
-            # 尝试从父窗口获取脚本列表，然后显示相关信息
-            scripts_list = self.parent().get_available_scripts() if hasattr(self.parent(), 'get_available_scripts') else []
-            if script_path in scripts_list:
-                # 显示简单的占位符信息
-                self.script_details_text.setPlainText(f"脚本: {script_path}\n状态: 已配置")
-            else:
-                self.script_details_text.setPlainText("未选择或未找到该脚本配置")
+            self.script_details_text.setPlainText("未选择或未找到该脚本配置")
     
     def get_values(self):
         """获取输入的值"""
-        # 获取选中的依赖项
-        selected_deps = []
-        for i in range(self.depends_list.count()):
-            item = self.depends_list.item(i)
-            if item.isSelected():
-                selected_deps.append(item.text())
+        # 获取选中的依赖项，只访问选中的行，并按列表中的先后顺序排列
+        selected_deps = [
+            index.data() for index in sorted(self.depends_list.selectedIndexes(), key=QModelIndex.row)
+        ]
         
         return (
             self.id_edit.text(),
@@ -1750,6 +2048,10 @@ class TaskChainDialog(QDialog):
 
 def main():
     """主函数"""
+    QApplication.setAttribute(Qt.AA_ShareOpenGLContexts)
+    # 合并高频的鼠标移动、缩放和手写板事件
+    QApplication.setAttribute(Qt.AA_CompressHighFrequencyEvents)
+    QApplication.setAttribute(Qt.AA_CompressTabletEvents)
     app = QApplication(sys.argv)
     
     # 设置应用属性
@@ -1760,8 +2062,12 @@ def main():
     window = ModernMainWindow()
     window.show()
     
-    # 运行应用
-    sys.exit(app.exec_())
+    # 运行应用（Qt事件循环同时驱动asyncio协程）
+    QtAsyncio.run(handle_sigint=True)
+    
+    # QtAsyncio.run不返回QApplication.exec()的退出码：事件循环只会因退出应用而正常结束，
+    # Ctrl+C按默认方式直接以信号终止进程，因此循环结束后以0作为进程退出状态
+    sys.exit(0)
 
 
 if __name__ == "__main__":
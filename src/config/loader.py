@@ -2,14 +2,40 @@
 配置加载器
 负责加载、解析和合并配置文件
 """
+import copy
 import yaml
 import json
 from pathlib import Path
 from typing import Dict, Any, Optional, Union
 from .models import MainConfiguration, ConfigSimplifier
+from ..utils.config_parser import YAML_LOADER
 from .validators import ConfigValidator
 import re
 
+# 匹配 ${variable} 格式的变量引用
+_VAR_RE = re.compile(r'\$\{([^}]+)\}')
+
+# 已解析配置缓存：解析后的路径 -> (修改时间, 文件大小, 配置)
+# 放在模块级，各处按次新建的ConfigLoader实例也能复用
+_config_cache: Dict[str, tuple] = {}
+
+
+def _deep_merge(base: Dict, override: Dict) -> Dict:
+    """深度合并两个字典，override 中的值优先"""
+    merged = base.copy()
+    # 用显式栈代替递归合并嵌套字典
+    stack = [(merged, override)]
+    while stack:
+        dst, src = stack.pop()
+        for key, value in src.items():
+            current = dst.get(key)
+            if isinstance(current, dict) and isinstance(value, dict):
+                dst[key] = current = current.copy()
+                stack.append((current, value))
+            else:
+                dst[key] = value
+    return merged
+
 
 class ConfigLoader:
     """配置加载器"""
@@ -19,17 +45,27 @@ class ConfigLoader:
         self.game_specific_config_path = None
         self.user_override_config_path = None
     
+    def _load_cached(self, file_path: Path, parse) -> Dict[str, Any]:
+        """文件未变化时复用上次解析结果，返回副本以免调用方修改缓存"""
+        st = file_path.stat()
+        key = str(file_path.resolve())
+        cached = _config_cache.get(key)
+        if cached is None or cached[:2] != (st.st_mtime_ns, st.st_size):
+            with open(file_path, 'r', encoding='utf-8') as f:
+                cached = (st.st_mtime_ns, st.st_size, parse(f))
+            _config_cache[key] = cached
+        return copy.deepcopy(cached[2])
+    
     def load_yaml_config(self, file_path: Union[str, Path]) -> Dict[str, Any]:
         """加载YAML配置文件"""
         file_path = Path(file_path)
         if not file_path.exists():
             raise FileNotFoundError(f"配置文件不存在: {file_path}")
         
-        with open(file_path, 'r', encoding='utf-8') as f:
-            try:
-                return yaml.safe_load(f) or {}
-            except yaml.YAMLError as e:
-                raise ValueError(f"YAML配置文件格式错误: {e}")
+        try:
+            return self._load_cached(file_path, lambda f: yaml.load(f, Loader=YAML_LOADER) or {})
+        except yaml.YAMLError as e:
+            raise ValueError(f"YAML配置文件格式错误: {e}")
     
     def load_json_config(self, file_path: Union[str, Path]) -> Dict[str, Any]:
         """加载JSON配置文件"""
@@ -37,81 +73,69 @@ class ConfigLoader:
         if not file_path.exists():
             raise FileNotFoundError(f"配置文件不存在: {file_path}")
         
-        with open(file_path, 'r', encoding='utf-8') as f:
-            try:
-                return json.load(f) or {}
-            except json.JSONDecodeError as e:
-                raise ValueError(f"JSON配置文件格式错误: {e}")
+        try:
+            return self._load_cached(file_path, lambda f: json.load(f) or {})
+        except json.JSONDecodeError as e:
+            raise ValueError(f"JSON配置文件格式错误: {e}")
     
     def merge_configs(self, base_config: Dict[str, Any], override_config: Dict[str, Any]) -> Dict[str, Any]:
         """合并基础配置和覆盖配置"""
-        merged = base_config.copy()
-        
-        def deep_merge(base: Dict, override: Dict) -> Dict:
-            """深度合并两个字典"""
-            result = base.copy()
-            for key, value in override.items():
-                if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                    result[key] = deep_merge(result[key], value)
-                else:
-                    result[key] = value
-            return result
-        
-        return deep_merge(merged, override_config)
+        return _deep_merge(base_config, override_config)
     
     def resolve_variables(self, config: Dict[str, Any], variables: Dict[str, Any]) -> Dict[str, Any]:
         """解析配置中的变量引用"""
-        def replace_vars(obj):
-            if isinstance(obj, str):
-                # 查找并替换 ${variable} 格式的变量
-                pattern = r'\$\{([^}]+)\}'
-                result = obj
-                # 持续替换直到不再有变量引用
-                max_iterations = 10  # 防止无限循环
-                iteration = 0
-                while True:
-                    iteration += 1
-                    if iteration > max_iterations:
-                        break  # 防止无限循环
-                    matches = re.findall(pattern, result)
-                    if not matches:
-                        break
-                    for var_name in matches:
-                        # 支持两种格式的变量引用：直接变量名或 variables.变量名
-                        value = None
-                        if var_name in variables:
-                            value = variables[var_name]
-                        elif var_name.startswith('variables.') and var_name[10:] in variables:  # 10是'variables.'的长度
-                            actual_var_name = var_name[10:]
-                            value = variables[actual_var_name]
-                        elif var_name.startswith('image_templates.') and var_name in config.get('image_templates', {}):
-                            # 处理 image_templates 引用
-                            value = config.get('image_templates', {}).get(var_name, var_name)
-                        
-                        if value is not None:
-                            # 保持原始值的类型
-                            if isinstance(value, str):
-                                result = result.replace(f"${{{var_name}}}", value)
-                            else:
-                                result = str(value)  # 将非字符串值转换为字符串
-                        else:
-                            # 如果变量未找到，保留原字符串
-                            break
-                    else:
-                        continue
-                    break
-                return result
-            elif isinstance(obj, dict):
-                new_dict = {}
-                for k, v in obj.items():
-                    new_dict[k] = replace_vars(v)
-                return new_dict
-            elif isinstance(obj, list):
-                return [replace_vars(item) for item in obj]
+        image_templates = config.get('image_templates', {})
+        
+        def lookup(match):
+            # 支持两种格式的变量引用：直接变量名或 variables.变量名
+            var_name = match.group(1)
+            if var_name in variables:
+                value = variables[var_name]
+            elif var_name.startswith('variables.') and var_name[10:] in variables:  # 10是'variables.'的长度
+                value = variables[var_name[10:]]
+            elif var_name.startswith('image_templates.') and var_name in image_templates:
+                # 处理 image_templates 引用
+                value = image_templates[var_name]
             else:
-                return obj
+                value = None
+            if value is None:
+                # 变量未找到或值为空时，保留原引用
+                return match.group(0)
+            return value if isinstance(value, str) else str(value)
         
-        return replace_vars(config)
+        def replace_str(text):
+            # 绝大多数字符串不含变量引用，无需进入正则
+            if '${' not in text:
+                return text
+            result = text
+            # 持续替换直到不再有变化，以支持嵌套引用
+            for _ in range(10):  # 防止无限循环
+                replaced = _VAR_RE.sub(lookup, result)
+                if replaced == result:
+                    break
+                result = replaced
+            return result
+        
+        def new_container(obj):
+            return {} if isinstance(obj, dict) else [None] * len(obj)
+        
+        if not isinstance(config, (dict, list)):
+            return replace_str(config) if isinstance(config, str) else config
+        
+        # 用显式栈代替递归遍历嵌套的字典和列表
+        resolved = new_container(config)
+        stack = [(config, resolved)]
+        while stack:
+            src, dst = stack.pop()
+            for key, value in (src.items() if isinstance(src, dict) else enumerate(src)):
+                if isinstance(value, str):
+                    dst[key] = replace_str(value)
+                elif isinstance(value, (dict, list)):
+                    dst[key] = new_container(value)
+                    stack.append((value, dst[key]))
+                else:
+                    dst[key] = value
+        return resolved
     
     def convert_legacy_config_to_new_format(self, legacy_config: Dict[str, Any]) -> Dict[str, Any]:
         """将旧格式配置转换为新格式"""
@@ -126,6 +150,7 @@ class ConfigLoader:
         name = resolved_config.get('name', 'ScriptZero')
         logging_config = resolved_config.get('logging', {})
         variables_resolved = resolved_config.get('variables', {})
+        image_templates = resolved_config.get('image_templates', {})
         
         # 初始化新格式配置
         new_config = {
@@ -147,14 +172,14 @@ class ConfigLoader:
                 "timeout": int(variables_resolved.get('timeout', 3600)),
                 "close_after_completion": bool(variables_resolved.get('close_after_completion', True)),
                 "image_templates": {
-                    "initial_start_btn": resolved_config.get('image_templates', {}).get('bettergi_initial_start_btn', ''),
-                    "dragon_btn_before": resolved_config.get('image_templates', {}).get('bettergi_dragon_btn_before', ''),
-                    "blue_play_btn": resolved_config.get('image_templates', {}).get('bettergi_blue_play_btn', ''),
-                    "dragon_btn_after": resolved_config.get('image_templates', {}).get('bettergi_dragon_btn_after', ''),
-                    "general_start_btn": resolved_config.get('image_templates', {}).get('bettergi_start_btn', ''),
-                    "general_dragon_btn": resolved_config.get('image_templates', {}).get('bettergi_dragon_btn', ''),
-                    "general_play_btn": resolved_config.get('image_templates', {}).get('bettergi_play_btn', ''),
-                    "automation_complete": resolved_config.get('image_templates', {}).get('automation_complete', ''),
+                    "initial_start_btn": image_templates.get('bettergi_initial_start_btn', ''),
+                    "dragon_btn_before": image_templates.get('bettergi_dragon_btn_before', ''),
+                    "blue_play_btn": image_templates.get('bettergi_blue_play_btn', ''),
+                    "dragon_btn_after": image_templates.get('bettergi_dragon_btn_after', ''),
+                    "general_start_btn": image_templates.get('bettergi_start_btn', ''),
+                    "general_dragon_btn": image_templates.get('bettergi_dragon_btn', ''),
+                    "general_play_btn": image_templates.get('bettergi_play_btn', ''),
+                    "automation_complete": image_templates.get('automation_complete', ''),
                 }
             },
             "adapters": []
@@ -289,20 +314,23 @@ class ConfigLoader:
         return MainConfiguration.create_default(game_name=game_name)
     
     def validate_and_fix_paths(self, config: MainConfiguration) -> MainConfiguration:
-        """验证并修正配置中的路径"""
-        # 这里可以添加路径修正逻辑
-        # 例如：将相对路径转换为绝对路径
-        config_dict = config.dict()
-        
-        # 修正游戏配置中的路径
-        if 'game' in config_dict:
-            game_config = config_dict['game']
-            if 'genshin_path' in game_config and game_config['genshin_path']:
-                game_config['genshin_path'] = str(Path(game_config['genshin_path']).resolve())
-            if 'bettergi_path' in game_config and game_config['bettergi_path']:
-                game_config['bettergi_path'] = str(Path(game_config['bettergi_path']).resolve())
-            if 'templates_path' in game_config and game_config['templates_path']:
-                game_config['templates_path'] = str(Path(game_config['templates_path']).resolve())
-        
-        # 返回修正后的配置
-        return MainConfiguration(**config_dict)
\ No newline at end of file
+        """
+        验证并修正配置中的路径
+        
+        直接修改传入配置的 game 字段（相对路径转换为绝对路径），不创建副本
+        
+        Args:
+            config: 待修正的配置对象
+        
+        Returns:
+            MainConfiguration: 修正后的同一个配置对象
+        """
+        game_config = config.game
+        if game_config.genshin_path:
+            game_config.genshin_path = str(Path(game_config.genshin_path).resolve())
+        if game_config.bettergi_path:
+            game_config.bettergi_path = str(Path(game_config.bettergi_path).resolve())
+        if game_config.templates_path:
+            game_config.templates_path = str(Path(game_config.templates_path).resolve())
+        
+        return config
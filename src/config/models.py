@@ -6,6 +6,7 @@ from typing import Dict, List, Optional, Union, Any  # 添加 Any 到导入
 from pathlib import Path
 from pydantic import BaseModel, Field, validator
 import yaml
+from ..utils.config_parser import YAML_LOADER
 
 
 class AdapterConfig(BaseModel):
@@ -95,7 +96,7 @@ class MainConfiguration(BaseModel):
     def load_from_file(cls, file_path: str):
         """从文件加载配置"""
         with open(file_path, 'r', encoding='utf-8') as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=YAML_LOADER)
         return cls(**data)
     
     @classmethod
@@ -3,6 +3,7 @@ ScriptZero - 零适配游戏自动化框架主类
 协调各个模块的工作
 """
 import asyncio
+import threading
 import time
 from typing import Dict, Any, List, Optional, Callable
 from pathlib import Path
@@ -10,7 +11,7 @@ from pathlib import Path
 import pyautogui
 import pydirectinput
 
-from .utils.config_validator import load_and_validate_config, MainConfig
+from .utils.config_validator import load_and_validate_config, validate_config_dict, MainConfig
 
 
 class GameAutomationFramework:
@@ -36,6 +37,14 @@ class GameAutomationFramework:
         if config_path and Path(config_path).exists():
             self.load_and_validate_config(config_path)
     
+    @classmethod
+    def from_dict(cls, config_dict: Dict[str, Any]) -> "GameAutomationFramework":
+        """从内存中的配置字典创建框架实例，无需先写入配置文件"""
+        framework = cls()
+        framework.config = validate_config_dict(config_dict)
+        print(f"配置验证成功: {framework.config.name}")
+        return framework
+    
     def _init_scheduler(self):
         """初始化调度器"""
         try:
@@ -51,8 +60,9 @@ class GameAutomationFramework:
         self.config = load_and_validate_config(config_path)
         print(f"配置验证成功: {self.config.name}")
     
-    async def execute_workflow(self, workflow_name: Optional[str] = None):
-        """执行工作流"""
+    async def execute_workflow(self, workflow_name: Optional[str] = None,
+                               cancel_event: Optional[threading.Event] = None):
+        """执行工作流，cancel_event被设置后在下一个工作流或步骤开始前停止"""
         if not self.config:
             raise ValueError("配置未加载")
         
@@ -71,10 +81,17 @@ class GameAutomationFramework:
                 raise ValueError(f"Workflow '{workflow_name}' not found")
         
         for workflow in workflows:
+            self._check_cancelled(cancel_event)
             if workflow.enabled:  # 只执行启用的工作流
-                await self.execute_single_workflow(workflow)
+                await self.execute_single_workflow(workflow, cancel_event)
+    
+    @staticmethod
+    def _check_cancelled(cancel_event: Optional[threading.Event]):
+        """取消令牌已设置时抛出CancelledError，在工作流和各步骤之间协作式地停止执行"""
+        if cancel_event is not None and cancel_event.is_set():
+            raise asyncio.CancelledError()
     
-    async def execute_single_workflow(self, workflow):
+    async def execute_single_workflow(self, workflow, cancel_event: Optional[threading.Event] = None):
         """执行单个工作流"""
         workflow_type = workflow.type
         workflow_name = workflow.name
@@ -82,13 +99,13 @@ class GameAutomationFramework:
         print(f"开始执行工作流: {workflow_name}")
         
         if workflow_type == 'game':
-            await self.execute_game_workflow(workflow)
+            await self.execute_game_workflow(workflow, cancel_event)
         elif workflow_type == 'script_chain':
-            await self.execute_script_chain(workflow)
+            await self.execute_script_chain(workflow, cancel_event)
         elif workflow_type == 'adapter_sequence':
-            await self.execute_adapter_sequence(workflow)
+            await self.execute_adapter_sequence(workflow, cancel_event)
         elif workflow_type == 'scheduled':
-            await self.execute_scheduled_workflow(workflow)
+            await self.execute_scheduled_workflow(workflow, cancel_event)
         elif workflow_type == 'genshin_bettergi':
             await self.execute_genshin_bettergi_workflow(workflow)
         elif workflow_type == 'task_chain':
@@ -172,11 +189,11 @@ class GameAutomationFramework:
         # 执行任务链
         await chain_scheduler.execute_chain(task_ids, workflow.config.get('error_handling', 'continue'))
     
-    async def execute_scheduled_workflow(self, workflow):
+    async def execute_scheduled_workflow(self, workflow, cancel_event: Optional[threading.Event] = None):
         """执行计划工作流（使用调度器）"""
         if not self.scheduler:
             print("调度器不可用，回退到普通执行模式")
-            await self.execute_script_chain(workflow)
+            await self.execute_script_chain(workflow, cancel_event)
             return
         
         print("使用调度器执行计划工作流...")
@@ -248,7 +265,7 @@ class GameAutomationFramework:
         # 根据配置执行相应的操作
         return {"status": "completed", "config": task_config}
     
-    async def execute_game_workflow(self, workflow):
+    async def execute_game_workflow(self, workflow, cancel_event: Optional[threading.Event] = None):
         """执行游戏相关工作流"""
         if not self.config:
             raise ValueError("配置未加载")
@@ -265,6 +282,7 @@ class GameAutomationFramework:
         
         actions = workflow.config.get('actions', [])
         for action in actions:
+            self._check_cancelled(cancel_event)
             action_type = action.get('type')
             
             if action_type == 'launch':
@@ -275,7 +293,7 @@ class GameAutomationFramework:
                 await self.wait_for_condition(condition, timeout)
             elif action_type == 'input':
                 sequence = action.get('sequence', [])
-                await self.execute_input_sequence(sequence)
+                await self.execute_input_sequence(sequence, cancel_event)
             elif action_type in ['click', 'double_click', 'right_click', 'move_to', 'drag_to', 
                                 'key_press', 'key_hold', 'type_text', 'wait_for_image', 'find_and_click']:
                 # 直接执行自动化操作
@@ -283,7 +301,7 @@ class GameAutomationFramework:
             else:
                 print(f"未知动作类型: {action_type}")
     
-    async def execute_script_chain(self, workflow):
+    async def execute_script_chain(self, workflow, cancel_event: Optional[threading.Event] = None):
         """执行脚本链"""
         if not self.config:
             raise ValueError("配置未加载")
@@ -302,15 +320,16 @@ class GameAutomationFramework:
         
         # 执行直接操作
         for action in actions:
+            self._check_cancelled(cancel_event)
             action_type = action.get('type')
             if action_type in ['click', 'double_click', 'right_click', 'move_to', 'drag_to', 
                               'key_press', 'key_hold', 'type_text', 'wait_for_image', 'find_and_click']:
                 await self.execute_automation_action(action)
         
         # 执行脚本
-        await self.execute_scripts_sequentially(scripts)
+        await self.execute_scripts_sequentially(scripts, cancel_event)
     
-    async def execute_adapter_sequence(self, workflow):
+    async def execute_adapter_sequence(self, workflow, cancel_event: Optional[threading.Event] = None):
         """执行适配器序列 - 包含启动游戏、启动脚本框架、执行自动化操作"""
         print("执行适配器序列...")
         
@@ -318,6 +337,7 @@ class GameAutomationFramework:
         script_framework_config = workflow.config.get('script_framework')
         if script_framework_config:
             await self.launch_script_framework(script_framework_config)
+        self._check_cancelled(cancel_event)
         
         # 2. 启动游戏（如果指定）
         game_config_name = workflow.config.get('game_config')
@@ -329,6 +349,7 @@ class GameAutomationFramework:
         # 3. 执行自动化步骤
         automation_steps = workflow.config.get('automation_steps', [])
         for step in automation_steps:
+            self._check_cancelled(cancel_event)
             await self.execute_automation_step(step)
     
     async def launch_script_framework(self, config: Dict[str, Any]):
@@ -438,12 +459,14 @@ class GameAutomationFramework:
             print(f"图像识别失败: {e}")
             return False
     
-    async def execute_scripts_sequentially(self, scripts: List[Dict[str, Any]]):
+    async def execute_scripts_sequentially(self, scripts: List[Dict[str, Any]],
+                                           cancel_event: Optional[threading.Event] = None):
         """顺序执行脚本列表"""
         from .engine.executor.async_executor import AsyncScriptExecutor
         executor = AsyncScriptExecutor()
         
         for script_config in scripts:
+            self._check_cancelled(cancel_event)
             # 检查执行条件
             conditions = script_config.get('conditions')
             if conditions:
@@ -530,9 +553,11 @@ class GameAutomationFramework:
             return list(games.keys())[0]  # 返回第一个游戏名称
         return 'unknown'
     
-    async def execute_input_sequence(self, sequence: List[Dict[str, Any]]):
+    async def execute_input_sequence(self, sequence: List[Dict[str, Any]],
+                                     cancel_event: Optional[threading.Event] = None):
         """执行输入序列"""
         for item in sequence:
+            self._check_cancelled(cancel_event)
             delay = item.get('delay', 0.1)
             
             if 'key' in item:
@@ -819,14 +844,19 @@ class GameAutomationFramework:
         if self.progress_callback:
             self.progress_callback(percentage, message)
     
-    async def run(self, workflow_name: Optional[str] = None):
-        """运行框架"""
+    async def run(self, workflow_name: Optional[str] = None,
+                  cancel_event: Optional[threading.Event] = None):
+        """运行框架，可通过cancel_event协作式地停止执行"""
         self.log_message("启动ScriptZero - 零适配游戏自动化框架...")
         self.update_status("正在运行")
         try:
-            await self.execute_workflow(workflow_name)
+            await self.execute_workflow(workflow_name, cancel_event)
             self.log_message("工作流执行完成")
             self.update_status("已完成")
+        except asyncio.CancelledError:
+            self.log_message("执行已取消")
+            self.update_status("已停止")
+            raise
         except Exception as e:
             self.log_message(f"执行出错: {str(e)}")
             self.update_status("错误")
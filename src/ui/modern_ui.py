@@ -21,6 +21,7 @@ except ImportError:
     HAS_TTKBOOTSTRAP = False
 
 from ..game_automation_framework import GameAutomationFramework
+from ..utils.config_parser import YAML_LOADER
 
 
 class ModernUI:
@@ -617,7 +618,7 @@ class ModernUI:
                     if file_path.endswith('.json'):
                         self.current_config = json.load(f)
                     else:
-                        self.current_config = yaml.safe_load(f)
+                        self.current_config = yaml.load(f, Loader=YAML_LOADER)
                 
                 self.current_config_path = file_path
                 self.config_path_var.set(file_path)
@@ -1281,7 +1282,7 @@ class ModernUI:
                     if file_path.endswith('.json'):
                         imported_vars = json.load(f)
                     else:
-                        imported_vars = yaml.safe_load(f)
+                        imported_vars = yaml.load(f, Loader=YAML_LOADER)
                 
                 # 清空现有变量
                 for item in self.variables_tree.get_children():
@@ -250,7 +250,8 @@ adapters: []
         
         try:
             # 解析配置验证格式
-            config = yaml.safe_load(config_content)
+            from src.utils.config_parser import YAML_LOADER
+            config = yaml.load(config_content, Loader=YAML_LOADER)
             if not config:
                 raise ValueError("配置文件格式不正确")
         except Exception as e:
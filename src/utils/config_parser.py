@@ -7,6 +7,34 @@ import json
 from pathlib import Path
 from typing import Dict, Any, Union
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# 优先使用libyaml的C实现，不可用时回退到纯Python实现
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+def dump_yaml(data, stream=None):
+    """
+    以统一格式序列化YAML
+    保持键的原有顺序，并关闭长字符串（如路径）的自动折行
+    """
+    return yaml.dump(data, stream, Dumper=YAML_DUMPER, default_flow_style=False,
+                     allow_unicode=True, sort_keys=False, width=10_000)
+
+
+def dump_json(data) -> bytes:
+    """
+    序列化为缩进两格的UTF-8 JSON字节串
+    安装了orjson时使用其C实现，否则回退到标准库json
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
 
 class ConfigParser:
     """配置解析器"""
@@ -15,7 +43,7 @@ class ConfigParser:
     def parse_yaml(file_path: str) -> Dict[str, Any]:
         """解析YAML配置文件"""
         with open(file_path, 'r', encoding='utf-8') as f:
-            return yaml.safe_load(f)
+            return yaml.load(f, Loader=YAML_LOADER)
     
     @staticmethod
     def parse_json(file_path: str) -> Dict[str, Any]:
@@ -5,7 +5,9 @@
 from pydantic import BaseModel, Field, validator, FilePath, DirectoryPath
 from typing import List, Dict, Optional, Union
 from pathlib import Path
+import json
 import yaml
+from .config_parser import YAML_LOADER
 
 
 class GameConfig(BaseModel):
@@ -90,9 +92,8 @@ def load_and_validate_config(config_path: Union[str, Path]) -> MainConfig:
     
     if config_path.suffix.lower() in ['.yaml', '.yml']:
         with open(config_path, 'r', encoding='utf-8') as f:
-            config_dict = yaml.safe_load(f)
+            config_dict = yaml.load(f, Loader=YAML_LOADER)
     elif config_path.suffix.lower() == '.json':
-        import json
         with open(config_path, 'r', encoding='utf-8') as f:
             config_dict = json.load(f)
     else:
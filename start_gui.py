@@ -43,7 +43,7 @@ def main():
         except ImportError as e2:
             print(f"GUI模块导入失败: {e2}")
             print("请确保安装了必要的GUI库:")
-            print("  pip install PySide6 ttkbootstrap")
+            print("  pip install PySide6-Essentials ttkbootstrap")
             sys.exit(1)
 
 if __name__ == "__main__":
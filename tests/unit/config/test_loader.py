@@ -0,0 +1,131 @@
+"""
+配置加载器单元测试
+"""
+import copy
+from src.config.loader import ConfigLoader
+
+
+class TestResolveVariables:
+    """变量引用解析测试"""
+    
+    def test_non_string_value_substituted_in_place(self):
+        """测试非字符串变量值按字符串嵌入原位置"""
+        loader = ConfigLoader()
+        config = {"interval": "${check_interval}", "label": "n=${check_interval}"}
+        
+        resolved = loader.resolve_variables(config, {"check_interval": 30})
+        
+        assert resolved == {"interval": "30", "label": "n=30"}
+    
+    def test_unknown_reference_kept(self):
+        """测试未知变量引用保持原样，其余引用照常解析"""
+        loader = ConfigLoader()
+        config = {"path": "${missing}/${root}"}
+        
+        resolved = loader.resolve_variables(config, {"root": "C:/Games"})
+        
+        assert resolved == {"path": "${missing}/C:/Games"}
+    
+    def test_none_value_kept_as_reference(self):
+        """测试值为None的变量不会被替换为'None'"""
+        loader = ConfigLoader()
+        config = {"f": "${z}", "g": "${variables.z}"}
+        
+        resolved = loader.resolve_variables(config, {"z": None})
+        
+        assert resolved == {"f": "${z}", "g": "${variables.z}"}
+    
+    def test_nested_reference_chain(self):
+        """测试嵌套变量引用逐层解析"""
+        loader = ConfigLoader()
+        variables = {"a": "${b}/x", "b": "${c}", "c": "C:/Games"}
+        config = {"nested": {"items": ["${a}", "${variables.b}"]}}
+        
+        resolved = loader.resolve_variables(config, variables)
+        
+        assert resolved == {"nested": {"items": ["C:/Games/x", "C:/Games"]}}
+
+
+class TestLoadCache:
+    """配置文件解析缓存测试"""
+    
+    def test_unchanged_file_served_from_cache(self, tmp_path, monkeypatch):
+        """测试文件未变化时不再重新解析，新建的加载器实例也共用缓存"""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("core:\n  log_level: INFO\n", encoding="utf-8")
+        
+        first = ConfigLoader().load_yaml_config(config_file)
+        monkeypatch.setattr("src.config.loader.yaml.load", lambda *args, **kwargs: {"reparsed": True})
+        second = ConfigLoader().load_yaml_config(config_file)
+        
+        assert first == second == {"core": {"log_level": "INFO"}}
+    
+    def test_rewritten_file_reparsed(self, tmp_path):
+        """测试文件被改写后重新解析"""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("core:\n  log_level: INFO\n", encoding="utf-8")
+        loader = ConfigLoader()
+        loader.load_yaml_config(config_file)
+        
+        config_file.write_text("core:\n  log_level: DEBUG\n", encoding="utf-8")
+        
+        assert loader.load_yaml_config(config_file) == {"core": {"log_level": "DEBUG"}}
+    
+    def test_returned_dict_mutation_isolated(self, tmp_path):
+        """测试修改返回结果不影响后续加载"""
+        config_file = tmp_path / "config.json"
+        config_file.write_text('{"core": {"log_level": "INFO"}}', encoding="utf-8")
+        loader = ConfigLoader()
+        
+        loader.load_json_config(config_file)["core"]["log_level"] = "ERROR"
+        
+        assert loader.load_json_config(config_file) == {"core": {"log_level": "INFO"}}
+
+
+class TestMergeConfigs:
+    """配置合并测试"""
+    
+    def test_nested_merge_without_mutating_inputs(self):
+        """测试嵌套字典逐层合并、列表整体替换且不修改输入"""
+        base = {
+            "core": {"log_level": "INFO", "max_workers": 4},
+            "game": {"image_templates": {"start": "a.png", "play": "b.png"}},
+            "adapters": [{"name": "base"}],
+        }
+        override = {
+            "core": {"log_level": "DEBUG"},
+            "game": {"image_templates": {"play": "c.png"}, "timeout": 60},
+            "adapters": [{"name": "override"}],
+        }
+        base_before = copy.deepcopy(base)
+        override_before = copy.deepcopy(override)
+        
+        merged = ConfigLoader().merge_configs(base, override)
+        
+        assert merged == {
+            "core": {"log_level": "DEBUG", "max_workers": 4},
+            "game": {"image_templates": {"start": "a.png", "play": "c.png"}, "timeout": 60},
+            "adapters": [{"name": "override"}],
+        }
+        assert base == base_before
+        assert override == override_before
+
+
+class TestValidateAndFixPaths:
+    """路径修正测试"""
+    
+    def test_relative_paths_fixed_in_place(self, tmp_path, monkeypatch):
+        """测试相对路径被转换为绝对路径，且返回原配置对象"""
+        monkeypatch.chdir(tmp_path)
+        loader = ConfigLoader()
+        config = loader.create_default_config()
+        config.game.genshin_path = "games/genshin.exe"
+        config.game.bettergi_path = None
+        config.game.templates_path = "templates"
+        
+        fixed = loader.validate_and_fix_paths(config)
+        
+        assert fixed is config
+        assert config.game.genshin_path == str((tmp_path / "games" / "genshin.exe").resolve())
+        assert config.game.bettergi_path is None
+        assert config.game.templates_path == str((tmp_path / "templates").resolve())